@@ -1,4 +1,6 @@
 import os
+import json
+import hashlib
 import threading
 import time
 import numpy as np
@@ -21,6 +23,101 @@ C_WAVE = "#444444"    # Bright Waveform
 
 INCREMENTS = [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1]
 
+# Loaded once per process and reused by every transcription
+_MODELS = {}
+_MODELS_LOCK = threading.Lock()
+
+def get_whisper_model(size="small", device="cpu", compute_type="int8"):
+    key = (size, device, compute_type)
+    with _MODELS_LOCK:
+        if key not in _MODELS:
+            _MODELS[key] = WhisperModel(size, device=device, compute_type=compute_type)
+        return _MODELS[key]
+
+# Word lists cached per 16 kHz audio content + decode settings
+CACHE_DIR = ".bts_cache"
+TRANSCRIBE_SETTINGS = {"model": "small", "compute_type": "int8", "language": None, "beam_size": 5}
+
+def cached_transcribe(path, y):
+    """Word list for 16 kHz audio `y`, served from disk when the same samples were decoded before."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(TRANSCRIBE_SETTINGS, sort_keys=True).encode("utf-8"))
+    h.update(np.ascontiguousarray(y, dtype=np.float32).tobytes())
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR, "transcripts")
+    cache_path = os.path.join(cache_dir, f"v1_{h.hexdigest()}.json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return [{'word': w, 'start': s, 'end': e, 'm_start': 0.0, 'm_end': 0.0} for w, s, e in json.load(f)]
+    except (OSError, ValueError):
+        pass
+    model = get_whisper_model(TRANSCRIBE_SETTINGS["model"], compute_type=TRANSCRIBE_SETTINGS["compute_type"])
+    segments, _ = model.transcribe(y, language=TRANSCRIBE_SETTINGS["language"],
+                                   beam_size=TRANSCRIBE_SETTINGS["beam_size"], word_timestamps=True)
+    words = [{'word': w.word.strip(), 'start': w.start, 'end': w.end, 'm_start': 0.0, 'm_end': 0.0}
+             for s in segments for w in s.words]
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump([[w['word'], w['start'], w['end']] for w in words], f)
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError as e:
+        print(f"[CACHE] Could not write transcript cache: {e}")
+    return words
+
+class WordIndex:
+    """Words sorted by start with a running max of ends: O(log n + k) range queries."""
+    def __init__(self):
+        self.rebuild([], [])
+
+    def rebuild(self, starts, ends):
+        starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+        self.order = np.argsort(starts, kind="stable")
+        self.starts, self.ends = starts[self.order], ends[self.order]
+        self.pos = np.empty_like(self.order); self.pos[self.order] = np.arange(len(self.order))
+        self.max_end = np.maximum.accumulate(self.ends) if len(self.ends) else self.ends.copy()
+
+    def update(self, i, start, end):
+        p = old = int(self.pos[i])
+        self.starts[p], self.ends[p] = start, end
+        while p > 0 and self.starts[p-1] > self.starts[p]: self._swap(p-1, p); p -= 1
+        while p < len(self.order)-1 and self.starts[p+1] < self.starts[p]: self._swap(p, p+1); p += 1
+        lo = min(p, old)
+        tail = np.maximum.accumulate(self.ends[lo:])
+        if lo > 0: np.maximum(tail, self.max_end[lo-1], out=tail)
+        self.max_end[lo:] = tail
+
+    def _swap(self, a, b):
+        for arr in (self.starts, self.ends, self.order): arr[a], arr[b] = arr[b], arr[a]
+        self.pos[self.order[a]], self.pos[self.order[b]] = a, b
+
+    def overlapping(self, t0, t1):
+        hi = int(np.searchsorted(self.starts, t1, side="right"))
+        lo = int(np.searchsorted(self.max_end, t0, side="left"))
+        if lo >= hi: return []
+        return self.order[lo:hi][self.ends[lo:hi] >= t0].tolist()
+
+class ItemPool:
+    """Reusable canvas items of one kind: moved with coords(), hidden when unused."""
+    def __init__(self, canvas, kind, tag, **opts):
+        self.canvas, self.kind, self.tag, self.opts = canvas, kind, tag, opts
+        self.items, self.used, self.shown = [], 0, 0
+
+    def begin(self): self.used = 0
+
+    def place(self, *coords, **opts):
+        if self.used < len(self.items):
+            item = self.items[self.used]
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state="normal", **opts)
+        else:
+            create = getattr(self.canvas, f"create_{self.kind}")
+            self.items.append(create(*coords, tags=self.tag, **{**self.opts, **opts}))
+        self.used += 1
+
+    def end(self):
+        for item in self.items[self.used:self.shown]: self.canvas.itemconfigure(item, state="hidden")
+        self.shown = self.used
+
 class ReviewDashboard(tk.Toplevel):
     def __init__(self, parent, word_list, audio_data, sr):
         super().__init__(parent)
@@ -94,18 +191,22 @@ class ReviewDashboard(tk.Toplevel):
 
     def adj(self, key, val, is_global):
         if is_global:
-            for w in self.words: w[key] = round(w.get(key, 0.0) + val, 4)
+            self.parent.global_ms[key] += round(val * 1000)
         else:
-            self.words[self.idx][key] = round(self.words[self.idx].get(key, 0.0) + val, 4)
+            w = self.words[self.idx]
+            w[key] = (round(w.get(key, 0.0) * 1000) + round(val * 1000)) / 1000
+            self.parent.reindex_word(self.idx)
         self.update_display()
         self.play_segment()
-        self.parent.update_canvas()
+        self.parent.request_redraw()
 
     def update_display(self):
         w = self.words[self.idx]
         self.lbl_word.config(text=f"'{w['word']}'")
         s, e = self.parent.get_effective_times(w)
-        self.lbl_margins.config(text=f"LOCAL OFFSETS -> Start: {w['m_start']:+.3f}s | End: {w['m_end']:+.3f}s")
+        g = self.parent.global_ms
+        self.lbl_margins.config(text=f"LOCAL OFFSETS -> Start: {w['m_start']:+.3f}s | End: {w['m_end']:+.3f}s"
+                                     f" (GLOBAL {g['m_start']/1000:+.3f}s / {g['m_end']/1000:+.3f}s)")
         self.lbl_stats.config(text=f"WORD {self.idx+1}/{len(self.words)} | FINAL DURATION: {e-s:.3f}s")
 
     def play_segment(self):
@@ -144,6 +245,11 @@ class BootlegTextSlicer(ctk.CTk):
         self.audio_data = None
         self.sr = 16000
         self.words = []
+        # Global margins in whole ms, added to every word at lookup time
+        self.global_ms = {'m_start': 0, 'm_end': 0}
+        # Hull of base and base+local interval per word, for hit-testing and culling
+        self.word_index = WordIndex()
+        self.index_dirty = True
         self.current_time = 0.0
         self.view_offset = 0.0
         self.view_duration = 6.0
@@ -152,8 +258,15 @@ class BootlegTextSlicer(ctk.CTk):
         self.dragging = None
         self.drag_target_idx = -1
 
+        # Redraws are requested (coalesced via after_idle); the 30 ms loop only runs while playing
+        self._redraw_id = None
+        self._loop_id = None
+        self._wave_key = None
+
         self.setup_ui()
-        self.update_loop()
+        self.request_redraw()
+        # Warm start: load the model while the user picks a file
+        threading.Thread(target=get_whisper_model, daemon=True).start()
 
     def setup_ui(self):
         self.header = ctk.CTkFrame(self, height=60, fg_color=C_CARD, corner_radius=0)
@@ -198,13 +311,41 @@ class BootlegTextSlicer(ctk.CTk):
         self.canvas.bind("<Button-1>", self.on_press)
         self.canvas.bind("<B1-Motion>", self.on_drag)
         self.canvas.bind("<ButtonRelease-1>", lambda e: setattr(self, 'dragging', None))
+        self.canvas.bind("<Configure>", lambda e: self.request_redraw())
+
+        self.wave_items = ItemPool(self.canvas, "line", "wave", fill=C_WAVE, width=2)
+        self.solid_items = ItemPool(self.canvas, "line", "word", width=2)
+        self.dash_items = ItemPool(self.canvas, "line", "word", dash=(5,5), width=2)
+        self.margin_labels = ItemPool(self.canvas, "text", "word", font=("Consolas", 9))
+        self.word_labels = ItemPool(self.canvas, "text", "word", fill="white", font=("Segoe UI", 12, "bold"))
+        self.playhead_item = self.canvas.create_line(0, 0, 0, 0, fill=C_PURPLE, width=3, state="hidden")
+
+    def get_offsets(self, w):
+        return (w['m_start'] + self.global_ms['m_start'] / 1000,
+                w['m_end'] + self.global_ms['m_end'] / 1000)
 
     def get_effective_times(self, w):
-        return w['start'] + w['m_start'], w['end'] + w['m_end']
+        off_s, off_e = self.get_offsets(w)
+        return w['start'] + off_s, w['end'] + off_e
+
+    def word_hull(self, w):
+        return min(w['start'], w['start'] + w['m_start']), max(w['end'], w['end'] + w['m_end'])
+
+    def words_between(self, t0, t1):
+        if self.index_dirty:
+            hulls = [self.word_hull(w) for w in self.words]
+            self.word_index.rebuild([h[0] for h in hulls], [h[1] for h in hulls])
+            self.index_dirty = False
+        # Hulls exclude the global margins; widen the query to cover them instead
+        g_s, g_e = self.global_ms['m_start'] / 1000, self.global_ms['m_end'] / 1000
+        return self.word_index.overlapping(t0 - max(0.0, g_e), t1 - min(0.0, g_s))
+
+    def reindex_word(self, i):
+        if not self.index_dirty: self.word_index.update(i, *self.word_hull(self.words[i]))
 
     def adj_global(self, key, val):
-        for w in self.words: w[key] = round(w.get(key, 0.0) + val, 4)
-        self.update_canvas()
+        self.global_ms[key] += round(val * 1000)
+        self.request_redraw()
 
     def load_audio(self):
         path = filedialog.askopenfilename()
@@ -219,10 +360,8 @@ class BootlegTextSlicer(ctk.CTk):
             self.audio_data = y
             duration = len(y) / sr
             
-            model = WhisperModel("small", device="cpu", compute_type="int8")
-            segments, _ = model.transcribe(path, word_timestamps=True)
-            self.words = [{'word': w.word.strip(), 'start': w.start, 'end': w.end, 'm_start': 0.0, 'm_end': 0.0} 
-                          for s in segments for w in s.words]
+            self.words = cached_transcribe(path, y)
+            self.index_dirty = True
             
             end_proc = time.time()
             elapsed = end_proc - start_proc
@@ -237,22 +376,31 @@ class BootlegTextSlicer(ctk.CTk):
             print("="*50 + "\n")
             
             self.status.configure(text=f"ACTIVE: {len(self.words)} WORDS LOADED")
+            self.after(0, self.request_redraw)
         except Exception as e: print(f"[ERROR] {e}")
 
     def toggle_play(self):
         if self.is_playing:
-            sd.stop(); self.is_playing = False
-            self.btn_play.configure(text="PLAY TRACK")
+            sd.stop(); self.stop_tracking()
         else:
             if self.audio_data is not None:
                 self.is_playing = True
-                self.start_time_real = time.time()
                 self.start_timestamp = self.current_time
                 sd.play(self.audio_data[int(self.current_time*self.sr):], self.sr)
+                # Track position on the output device's clock, offset by its latency
+                self.play_stream = sd.get_stream()
+                self.start_time_real = self.play_stream.time + self.play_stream.latency
                 self.btn_play.configure(text="STOP TRACK")
+                self.update_loop()
+
+    def stop_tracking(self):
+        self.is_playing = False
+        self.btn_play.configure(text="PLAY TRACK")
+        if self._loop_id is not None: self.after_cancel(self._loop_id); self._loop_id = None
 
     def play_word_static(self):
-        for w in self.words:
+        for i in self.words_between(self.current_time, self.current_time):
+            w = self.words[i]
             s, e = self.get_effective_times(w)
             if s <= self.current_time <= e:
                 sd.stop(); sd.play(self.audio_data[int(s*self.sr):int(e*self.sr)], self.sr)
@@ -263,20 +411,21 @@ class BootlegTextSlicer(ctk.CTk):
 
     def handle_scroll(self, event):
         self.view_offset = max(0, self.view_offset - (event.delta / 120) * 0.5)
-        self.update_canvas()
+        self.request_redraw()
 
     def on_press(self, e):
         pxs = self.canvas.winfo_width() / self.view_duration
         t = self.view_offset + (e.x / pxs)
         
-        for i, w in enumerate(self.words):
+        for i in self.words_between(t - 0.08, t + 0.08):
+            w = self.words[i]
             if abs(t - w['start']) < 0.08: self.dragging = "s"; self.drag_target_idx = i; return
             if abs(t - w['end']) < 0.08: self.dragging = "e"; self.drag_target_idx = i; return
 
         self.current_time = t
         if self.is_playing:
             self.toggle_play(); self.toggle_play() 
-        self.update_canvas()
+        self.request_redraw()
 
     def on_drag(self, e):
         pxs = self.canvas.winfo_width() / self.view_duration
@@ -284,37 +433,50 @@ class BootlegTextSlicer(ctk.CTk):
         if self.dragging == "s": self.words[self.drag_target_idx]['start'] = t
         elif self.dragging == "e": self.words[self.drag_target_idx]['end'] = t
         else: self.current_time = t
-        self.update_canvas()
+        if self.dragging: self.reindex_word(self.drag_target_idx)
+        self.request_redraw()
+
+    def request_redraw(self):
+        if self._redraw_id is None: self._redraw_id = self.after_idle(self.update_canvas)
 
     def update_loop(self):
-        if self.is_playing:
-            self.current_time = self.start_timestamp + (time.time() - self.start_time_real)
-            if self.current_time > self.view_offset + self.view_duration:
-                self.view_offset = self.current_time - (self.view_duration * 0.1)
+        self._loop_id = None
+        if not self.is_playing: return
+        # PLAY WORD and the dashboard replace (and close) the track's stream
+        stream = self.play_stream
+        try:
+            now = stream.time if sd.get_stream() is stream and stream.active else None
+        except (sd.PortAudioError, RuntimeError):
+            now = None
+        if now is None:
+            self.stop_tracking(); self.request_redraw(); return
+        played = max(0.0, now - self.start_time_real)
+        self.current_time = self.start_timestamp + played
+        if self.current_time >= len(self.audio_data) / self.sr:
+            self.toggle_play(); self.request_redraw(); return
+        if self.current_time > self.view_offset + self.view_duration:
+            self.view_offset = self.current_time - (self.view_duration * 0.1)
         self.update_canvas()
-        self.after(30, self.update_loop)
+        self._loop_id = self.after(30, self.update_loop)
 
     def update_canvas(self):
-        self.canvas.delete("all")
+        if self._redraw_id is not None: self.after_cancel(self._redraw_id); self._redraw_id = None
         win_w, win_h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if win_w < 10: return
-        pxs, midy = win_w / self.view_duration, win_h / 2
-
-        # Brighter Waveform using Peak Sampling
-        if self.audio_data is not None:
-            vi = int(self.view_offset * self.sr)
-            spp = int((self.view_duration * self.sr) / win_w)
-            for x in range(0, win_w, 4):
-                idx = vi + int((x / win_w) * (self.view_duration * self.sr))
-                if 0 <= idx < len(self.audio_data):
-                    chunk = self.audio_data[idx : idx + spp]
-                    if chunk.size > 0:
-                        amp = np.max(np.abs(chunk)) * (win_h * 0.45) * 1.6
-                        self.canvas.create_line(x, midy-amp, x, midy+amp, fill=C_WAVE, width=2)
-
-        # Word Rendering
-        for word in self.words:
-            s_eff, e_eff = self.get_effective_times(word)
+        pxs = win_w / self.view_duration
+
+        # Waveform columns only change with the view, size or audio
+        wave_key = (self.view_offset, self.view_duration, win_w, win_h, id(self.audio_data))
+        if wave_key != self._wave_key:
+            self._wave_key = wave_key
+            self.draw_waveform(win_w, win_h)
+
+        # Word Rendering (only words overlapping the view)
+        for pool in (self.solid_items, self.dash_items, self.margin_labels, self.word_labels): pool.begin()
+        for i in self.words_between(self.view_offset, self.view_offset + self.view_duration):
+            word = self.words[i]
+            off_s, off_e = self.get_offsets(word)
+            s_eff, e_eff = word['start'] + off_s, word['end'] + off_e
             xs_sol, xe_sol = (word['start']-self.view_offset)*pxs, (word['end']-self.view_offset)*pxs
             xs_dash, xe_dash = (s_eff-self.view_offset)*pxs, (e_eff-self.view_offset)*pxs
             
@@ -323,23 +485,47 @@ class BootlegTextSlicer(ctk.CTk):
 
             if xe_sol > 0 and xs_sol < win_w:
                 # Solid lines
-                self.canvas.create_line(xs_sol, 65, xs_sol, win_h-65, fill=color, width=2)
-                self.canvas.create_line(xe_sol, 65, xe_sol, win_h-65, fill=color, width=2)
+                self.solid_items.place(xs_sol, 65, xs_sol, win_h-65, fill=color)
+                self.solid_items.place(xe_sol, 65, xe_sol, win_h-65, fill=color)
                 
                 # Dashed lines + Labels
-                if word['m_start'] != 0:
-                    self.canvas.create_line(xs_dash, 45, xs_dash, win_h-45, fill=color, dash=(5,5), width=2)
-                    self.canvas.create_text(xs_dash, 35, text=f"{word['m_start']:+.3f}", fill=color, font=("Consolas", 9))
-                if word['m_end'] != 0:
-                    self.canvas.create_line(xe_dash, 45, xe_dash, win_h-45, fill=color, dash=(5,5), width=2)
-                    self.canvas.create_text(xe_dash, 35, text=f"{word['m_end']:+.3f}", fill=color, font=("Consolas", 9))
+                if off_s != 0:
+                    self.dash_items.place(xs_dash, 45, xs_dash, win_h-45, fill=color)
+                    self.margin_labels.place(xs_dash, 35, text=f"{off_s:+.3f}", fill=color)
+                if off_e != 0:
+                    self.dash_items.place(xe_dash, 45, xe_dash, win_h-45, fill=color)
+                    self.margin_labels.place(xe_dash, 35, text=f"{off_e:+.3f}", fill=color)
 
-                self.canvas.create_text(xs_sol+(xe_sol-xs_sol)/2, win_h*0.2, text=word['word'], fill="white", font=("Segoe UI", 12, "bold"))
+                self.word_labels.place(xs_sol+(xe_sol-xs_sol)/2, win_h*0.2, text=word['word'])
+        for pool in (self.solid_items, self.dash_items, self.margin_labels, self.word_labels): pool.end()
 
         # Playhead
         phx = (self.current_time - self.view_offset) * pxs
         if 0 <= phx <= win_w:
-            self.canvas.create_line(phx, 0, phx, win_h, fill=C_PURPLE, width=3)
+            self.canvas.coords(self.playhead_item, phx, 0, phx, win_h)
+            self.canvas.itemconfigure(self.playhead_item, state="normal")
+            self.canvas.tag_raise(self.playhead_item)
+        else:
+            self.canvas.itemconfigure(self.playhead_item, state="hidden")
+
+    def draw_waveform(self, win_w, win_h):
+        # Brighter Waveform using Peak Sampling: one reduceat pass over the visible samples
+        self.wave_items.begin()
+        if self.audio_data is not None:
+            midy = win_h / 2
+            span = self.view_duration * self.sr
+            xs = np.arange(0, win_w, 4)
+            idx = int(self.view_offset * self.sr) + (xs / win_w * span).astype(np.int64)
+            keep = (idx >= 0) & (idx < len(self.audio_data))
+            xs, idx = xs[keep], idx[keep]
+            if len(idx):
+                spp = max(1, int(span / win_w))
+                chunk = np.abs(self.audio_data[idx[0]:min(len(self.audio_data), idx[-1] + spp)])
+                amps = np.maximum.reduceat(chunk, idx - idx[0]) * (win_h * 0.45) * 1.6
+                for x, amp in zip(xs.tolist(), amps.tolist()):
+                    self.wave_items.place(x, midy-amp, x, midy+amp)
+        self.wave_items.end()
+        self.canvas.tag_lower("wave")
 
 if __name__ == "__main__":
     app = BootlegTextSlicer()
@@ -1,21 +1,50 @@
 import os
-import io
+import sys
+import glob
+import json
+import shutil
+import argparse
 import time
+import queue
+import sqlite3
+import hashlib
+import atexit
+import pstats
+import cProfile
 import threading
+import platform
+import contextlib
+import multiprocessing.util
+import tempfile
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 import numpy as np
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import filedialog, messagebox
 from pydub import AudioSegment
-import pygame
+from pydub.utils import mediainfo
+try:
+    import sounddevice as sd
+except OSError:  # PortAudio missing (e.g. headless batch servers)
+    sd = None
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+from matplotlib.patches import Rectangle
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
-import librosa
+import soxr
 import soundfile as sf
 from faster_whisper import WhisperModel
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:  # optional, only needed for BTS_PROFILE=pyinstrument
+    PyinstrumentProfiler = None
 
 # --- CONFIGURABLE VISUALS (blue waveform scheme) ---
 WAVEFORM_STROKE = 1.2
@@ -44,16 +73,1875 @@ MARGIN_POS_HOVER = "#0E71BD"
 MARGIN_NEG_FG = "#44150A"
 MARGIN_NEG_HOVER = "#BD140E"
 
+PROJECT_FILE = "cutProject.sqlite"
+# Legacy append-only template, imported into the project store when found
 CUT_TEMPLATE_FILE = "cutTemplate.txt"
 
 # Margin increments: -0.10 ... -0.01 +0.01 ... +0.10
 NEG_INCREMENTS = [0.10, 0.09, 0.08, 0.07, 0.06, 0.05, 0.04, 0.03, 0.02, 0.01]
 POS_INCREMENTS = [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.10]
 
-pygame.mixer.init()
+# Waveform peak pyramid: finest cached level holds one min/max pair per
+# PEAK_BASE_BLOCK samples, each coarser level merges PEAK_LEVEL_FACTOR bins.
+PEAK_BASE_BLOCK = 64
+PEAK_LEVEL_FACTOR = 4
+TIMELINE_MIN_BINS = 512
+
+# Decoded audio cache (next to the source file, keyed by content hash): raw
+# PCM, 16 kHz mono and peak files, memory-mapped instead of held in RAM.
+# Read-only source folders fall back to a per-user cache directory.
+# DECODE_BLOCK must stay a multiple of PEAK_BASE_BLOCK.
+AUDIO_CACHE_DIR = ".bts_cache"
+USER_CACHE_NAME = "bootleg-text-slicer"
+DECODE_BLOCK = 1 << 16
+PCM_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# Playback: one persistent low-latency output stream fed from the PCM buffer
+PLAYBACK_LATENCY = "low"
+PLAYHEAD_FRAME_MS = 16
+# Margin nudges are applied at once but rendered and auditioned only after
+# this much idle time, so a burst of clicks costs one replot and one playback
+MARGIN_IDLE_MS = 150
+
+# Whisper models stay resident between transcriptions (LRU under a memory cap)
+WHISPER_MODEL_SIZE = "small"
+WHISPER_COMPUTE_TYPE = "int8"
+WHISPER_DEVICE = "cpu"
+WHISPER_LANGUAGE = None  # auto-detect
+WHISPER_BEAM_SIZE = 5
+WHISPER_CACHE_MB = 3000
+# Approximate float32 footprint per model size, scaled by compute type below
+WHISPER_MODEL_MB = {
+    "tiny": 150, "base": 300, "small": 950, "medium": 3000,
+    "large-v1": 6000, "large-v2": 6000, "large-v3": 6000,
+}
+WHISPER_COMPUTE_SCALE = {"int8": 0.3, "int8_float32": 0.3, "int8_float16": 0.3, "float16": 0.55}
+
+# Chunked transcription: the whole file is split at the quietest frame near
+# every CHUNK_TARGET_S, so chunk + search + overlap fits one 30 s Whisper
+# window. Chunks are cached on disk and long selections decode them concurrently.
+PARALLEL_MIN_SECONDS = 120.0
+CHUNK_TARGET_S = 24.0
+CHUNK_SEARCH_S = 3.0
+CHUNK_OVERLAP_S = 1.5
+TRANSCRIPT_CACHE_DIR = "transcripts"
+SILENCE_FRAME_MS = 30
+TRANSCRIBE_WORKERS = max(1, min(8, (os.cpu_count() or 2) // 2))
+# The editor keeps one model for sequential and parallel decodes alike, so
+# the preloaded instance is the one every transcription reuses.
+TRANSCRIBE_MODEL_OPTIONS = {
+    "num_workers": TRANSCRIBE_WORKERS,
+    "cpu_threads": max(1, (os.cpu_count() or TRANSCRIBE_WORKERS) // TRANSCRIBE_WORKERS),
+}
+
+# Silero VAD (faster-whisper's vad_filter): only speech regions reach the
+# decoder and word times are mapped back onto the original timeline.
+VAD_FILTER = True
+VAD_PARAMETERS = {
+    "threshold": 0.5,
+    "min_speech_duration_ms": 100,
+    "min_silence_duration_ms": 500,
+    "speech_pad_ms": 200,
+}
+
+# Words stream into the UI while Whisper is still decoding
+TRANSCRIBE_POLL_MS = 50
+TRANSCRIBE_REPLOT_MS = 500
+PROGRESS_BAR_CELLS = 24
+
+# Side-panel word thumbnails: polygons from the peak pyramid, cached by (word, frames)
+THUMB_HEIGHT = 140
+THUMB_CACHE_SIZE = 256
+
+# Review lookahead: playback buffers, labels and thumbnails for the next words
+# (and the previous one) are prepared in the background
+LOOKAHEAD_WORDS = 6
+
+# Approvals are encoded by a background pool straight from the PCM buffer;
+# finished rows are committed to the project once per poll tick
+EXPORT_DIR = "ApprovedWords"
+EXPORT_FORMATS = ("wav", "flac", "ogg")
+EXPORT_WORKERS = max(2, os.cpu_count() or 2)
+EXPORT_POLL_MS = 100
+
+# Tracing: BTS_TRACE=<file> records spans and metrics as Chrome trace events
+# (".json" opens in chrome://tracing or Perfetto, any other name gets JSON
+# lines). BTS_PROFILE=cprofile|pyinstrument profiles the main thread of the
+# whole run into BTS_PROFILE_OUT.
+TRACE_FILE = os.environ.get("BTS_TRACE", "")
+TRACE_FLUSH_EVENTS = 512
+TRACE_FLUSH_S = 2.0
+# Playback start latency is measured on the audio thread and emitted this
+# long after the request, from the Tk thread
+PLAYBACK_TRACE_MS = 250
+PROFILE_MODE = os.environ.get("BTS_PROFILE", "").lower()
+PROFILE_FILE = os.environ.get("BTS_PROFILE_OUT", "")
+
 ctk.set_appearance_mode("dark")
 
 
+# -------------------- Tracing --------------------
+class _Span:
+    __slots__ = ("tracer", "name", "args", "t0")
+
+    def __init__(self, tracer, name, args):
+        self.tracer, self.name, self.args = tracer, name, args
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def __enter__(self):
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._complete(self.name, self.t0, time.perf_counter_ns(), self.args)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """Span and metric recorder, off unless BTS_TRACE names a file.
+
+    Disabled, `span` hands back a shared no-op context, so instrumented code
+    costs one call. Enabled, events are buffered and appended to the file
+    every TRACE_FLUSH_EVENTS events or TRACE_FLUSH_S seconds and at exit, so
+    it can stay on while operators reproduce a lag. Batch worker processes
+    write to "<name>.<pid><ext>" next to the main file.
+    """
+
+    def __init__(self, path=""):
+        self.enabled = bool(path)
+        self._root_path = path
+        self._chrome = path.lower().endswith(".json")
+        # A spawned worker (the Windows/macOS default) imports this module
+        # afresh, already under its own process name
+        spawned = multiprocessing.current_process().name != "MainProcess"
+        self._claim(child=spawned)
+        if self.enabled:
+            atexit.register(self.close)
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=self._claim)
+            if spawned:
+                self._close_with_process()
+            # Forked workers (also those of a forkserver) run this once
+            # multiprocessing has set them up; spawned ones never do
+            multiprocessing.util.register_after_fork(self, Tracer._after_process_start)
+
+    def span(self, name, **args):
+        """Context manager timing a block; `.set(...)` adds args before it ends."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, args)
+
+    def metric(self, name, value, **args):
+        """Record a counter sample (ms, counts, realtime factors)."""
+        if not self.enabled:
+            return
+        args[name] = value
+        self._emit({"name": name, "ph": "C", "ts": time.perf_counter_ns() // 1000, "args": args})
+
+    def _complete(self, name, t0, t1, args):
+        self._emit({"name": name, "ph": "X", "ts": t0 // 1000, "dur": (t1 - t0) / 1000.0,
+                    "args": args})
+
+    def _emit(self, event):
+        if os.getpid() != self._pid:
+            self._claim()
+        thread = threading.current_thread()
+        event["pid"] = os.getpid()
+        event["tid"] = thread.native_id
+        with self._lock:
+            if thread.native_id not in self._threads:
+                self._threads.add(thread.native_id)
+                self._events.append({"name": "thread_name", "ph": "M", "pid": event["pid"],
+                                     "tid": thread.native_id, "args": {"name": thread.name}})
+            self._events.append(event)
+            if (len(self._events) >= TRACE_FLUSH_EVENTS
+                    or time.monotonic() - self._last_flush >= TRACE_FLUSH_S):
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._events:
+            return
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+            if self._chrome:
+                self._file.write("[\n")
+        sep = ",\n" if self._chrome else "\n"
+        for event in self._events:
+            if self._chrome and not self._first:
+                self._file.write(sep)
+            self._file.write(json.dumps(event))
+            if not self._chrome:
+                self._file.write(sep)
+            self._first = False
+        self._file.flush()
+        self._events.clear()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                if self._chrome:
+                    self._file.write("\n]\n")
+                self._file.close()
+                self._file = None
+
+    def _claim(self, child=True):
+        """Start this process's own buffer and file; a child must not append
+        to its parent's file or replay its buffer."""
+        self._lock = threading.Lock()
+        self._events = []
+        self._threads = set()
+        self._file = None
+        self._first = True
+        self._last_flush = time.monotonic()
+        self._pid = os.getpid()
+        root, ext = os.path.splitext(self._root_path)
+        self.path = f"{root}.{self._pid}{ext}" if child else self._root_path
+
+    def _after_process_start(self):
+        self._claim()
+        self._close_with_process()
+
+    def _close_with_process(self):
+        # Pool workers leave through os._exit, which skips atexit; multiprocessing
+        # still runs its finalizers on a worker's normal shutdown
+        multiprocessing.util.Finalize(self, self.close, exitpriority=10)
+
+
+TRACE = Tracer(TRACE_FILE)
+
+
+@contextlib.contextmanager
+def profiling(mode=PROFILE_MODE, out=PROFILE_FILE):
+    """Profile the enclosed block with cProfile or pyinstrument (BTS_PROFILE)."""
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            out = out or "bts_profile.prof"
+            profiler.dump_stats(out)
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+            print(f"[PROFILE] cProfile stats written to {out}")
+    elif mode == "pyinstrument" and PyinstrumentProfiler is not None:
+        profiler = PyinstrumentProfiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            out = out or "bts_profile.html"
+            with open(out, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+            print(f"[PROFILE] pyinstrument report written to {out}")
+    else:
+        if mode:
+            print(f"[PROFILE] BTS_PROFILE={mode} is not available (cprofile, pyinstrument)")
+        yield
+
+
+# -------------------- Source audio --------------------
+def pcm_to_mono(block, sample_width):
+    """(frames, channels) integer PCM -> mono float32 in [-1, 1]."""
+    mono = block.mean(axis=1, dtype=np.float32)
+    mono *= 1.0 / float(1 << (8 * sample_width - 1))
+    return mono
+
+
+def pcm_to_float(block, sample_width):
+    """(frames, channels) integer PCM -> contiguous float32 in [-1, 1]."""
+    return np.multiply(block, 1.0 / float(1 << (8 * sample_width - 1)), dtype=np.float32)
+
+
+def _memmap(path, dtype, shape):
+    # np.memmap refuses empty files
+    if not shape[0]:
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
+
+
+class SourceAudio:
+    """Memory-mapped decode of one source file.
+
+    `pcm` is the native-rate (frames, channels) integer buffer used for
+    playback and export, `whisper` the 16 kHz mono float32 view for
+    transcription and `peaks` the waveform pyramid. All three are np.memmap
+    views over the decode cache, so only the windows that are read become
+    resident, whatever the file length.
+    """
+
+    def __init__(self, path, digest, meta, base, whisper_sr):
+        self.path = path
+        self.digest = digest
+        self.base = base
+        self.whisper_sr = whisper_sr
+        self.cache_dir = os.path.dirname(base)
+        # False when this load decoded the file instead of reusing the cache
+        self.cached = True
+        self.frame_rate = meta["frame_rate"]
+        self.channels = meta["channels"]
+        self.sample_width = meta["sample_width"]
+        self.frames = meta["frames"]
+        self.dbfs = meta["dbfs"]
+        self.pcm = _memmap(
+            base + ".pcm", PCM_DTYPES[self.sample_width], (self.frames, self.channels)
+        )
+        self.whisper = _memmap(base + f".{whisper_sr}.f32", np.float32, (meta["whisper_frames"],))
+        peaks = _memmap(base + ".peaks", np.float32, (meta["peak_pairs"], 2))
+        self.peaks = PeakPyramid.from_levels(self.frames, peaks, meta["peak_levels"], self.mono)
+
+    @property
+    def duration_ms(self):
+        return self.frames * 1000.0 / self.frame_rate if self.frame_rate else 0.0
+
+    def mono(self, start, end):
+        return pcm_to_mono(self.pcm[start:end], self.sample_width)
+
+    def discard(self):
+        """Drop the memory maps and delete this source's decode files."""
+        self.pcm = self.whisper = self.peaks = None
+        # Meta first: without it the rest reads as an incomplete cache
+        for suffix in (".json", ".pcm", f".{self.whisper_sr}.f32", ".peaks"):
+            try:
+                os.remove(self.base + suffix)
+            except FileNotFoundError:
+                pass
+
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _cache_dirs(path):
+    """Decode cache locations for `path`, preferred first: beside the source,
+    then the per-user cache, then the temp directory."""
+    user = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return (
+        os.path.join(os.path.dirname(os.path.abspath(path)), AUDIO_CACHE_DIR),
+        os.path.join(user, USER_CACHE_NAME),
+        os.path.join(tempfile.gettempdir(), USER_CACHE_NAME),
+    )
+
+
+def _writable_dir(path):
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(path, os.W_OK)
+
+
+def sndfile_read_spec(subtype):
+    """(read dtype, PCM sample width) for a libsndfile subtype.
+
+    Float subtypes are read as float32 and converted with `as_int_pcm`:
+    libsndfile does not scale floats read as integers, so they would all
+    truncate to 0.
+    """
+    if subtype in ("FLOAT", "DOUBLE"):
+        return "float32", 4
+    if subtype in ("PCM_24", "PCM_32"):
+        return "int32", 4
+    return "int16", 2
+
+
+def as_int_pcm(block):
+    """Integer PCM for a block read per `sndfile_read_spec` (float -> clipped int32)."""
+    if block.dtype.kind != "f":
+        return block
+    return np.multiply(np.clip(block, -1.0, 1.0), 2147483647.0, dtype=np.float64).astype(np.int32)
+
+
+def _soundfile_blocks(path):
+    """Block reader through libsndfile: WAV/FLAC/OGG/MP3 and friends."""
+    f = sf.SoundFile(path)
+    dtype, width = sndfile_read_spec(f.subtype)
+
+    def blocks():
+        with f:
+            for block in f.blocks(blocksize=DECODE_BLOCK, dtype=dtype, always_2d=True):
+                yield as_int_pcm(block)
+
+    return f.samplerate, f.channels, width, blocks()
+
+
+def _ffmpeg_blocks(path):
+    """Block reader through an ffmpeg s16le pipe, for containers libsndfile lacks."""
+    info = mediainfo(path)
+    rate, channels = int(info["sample_rate"]), int(info["channels"])
+    cmd = [AudioSegment.converter, "-v", "error", "-i", path, "-vn",
+           "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(rate), "-ac", str(channels), "-"]
+
+    def blocks():
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        try:
+            while raw := proc.stdout.read(DECODE_BLOCK * channels * 2):
+                yield np.frombuffer(raw, dtype=np.int16).reshape(-1, channels)
+        finally:
+            proc.stdout.close()
+            if proc.wait() != 0:
+                raise RuntimeError(f"ffmpeg could not decode {path}")
+
+    return rate, channels, 2, blocks()
+
+
+def _decode_to_cache(path, base, whisper_sr):
+    """Stream-decode `path` into the raw PCM, 16 kHz and peak files of the cache.
+
+    Works one DECODE_BLOCK at a time, so memory stays flat; returns the meta
+    dict that `SourceAudio` needs.
+    """
+    try:
+        rate, channels, width, blocks = _soundfile_blocks(path)
+    except RuntimeError:
+        rate, channels, width, blocks = _ffmpeg_blocks(path)
+    rs = soxr.ResampleStream(rate, whisper_sr, 1, dtype="float32") if rate != whisper_sr else None
+
+    frames = whisper_frames = 0
+    energy = 0.0
+    with open(base + ".pcm.tmp", "wb") as f_pcm, \
+            open(base + f".{whisper_sr}.f32.tmp", "wb") as f_whisper, \
+            open(base + ".peaks.tmp", "wb") as f_peaks:
+        for block in blocks:
+            f_pcm.write(np.ascontiguousarray(block).tobytes())
+            mono = pcm_to_mono(block, width)
+            energy += float(np.dot(mono, mono))
+            with TRACE.span("resample", frames=len(mono)):
+                resampled = rs.resample_chunk(mono) if rs else mono
+            f_whisper.write(resampled.tobytes())
+            whisper_frames += len(resampled)
+            # DECODE_BLOCK is a multiple of PEAK_BASE_BLOCK, so bins line up
+            starts = np.arange(0, len(mono), PEAK_BASE_BLOCK)
+            f_peaks.write(np.column_stack(
+                (np.minimum.reduceat(mono, starts), np.maximum.reduceat(mono, starts))
+            ).tobytes())
+            frames += len(block)
+        if rs:
+            tail = rs.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+            f_whisper.write(tail.tobytes())
+            whisper_frames += len(tail)
+
+    levels = _build_peak_levels(base + ".peaks.tmp", -(-frames // PEAK_BASE_BLOCK))
+    for suffix in (".pcm", f".{whisper_sr}.f32", ".peaks"):
+        os.replace(base + suffix + ".tmp", base + suffix)
+    rms = (energy / frames) ** 0.5 if frames else 0.0
+    return {
+        "source": os.path.basename(path),
+        "frame_rate": rate,
+        "channels": channels,
+        "sample_width": width,
+        "frames": frames,
+        "whisper_frames": whisper_frames,
+        "peak_pairs": levels[-1][1] + levels[-1][2] if levels else 0,
+        "peak_levels": levels,
+        "dbfs": 20.0 * np.log10(rms) if rms > 0 else None,
+    }
+
+
+def _build_peak_levels(peaks_path, n_base):
+    """Append the coarser pyramid levels to the peak file, a slice at a time.
+
+    Returns [(block_size, offset, count)] per level, finest first.
+    """
+    if not n_base:
+        return []
+    levels = [(PEAK_BASE_BLOCK, 0, n_base)]
+    step = PEAK_LEVEL_FACTOR * DECODE_BLOCK
+    while levels[-1][2] > PEAK_LEVEL_FACTOR:
+        block, offset, count = levels[-1]
+        prev = np.memmap(peaks_path, dtype=np.float32, mode="r", shape=(offset + count, 2))[offset:]
+        with open(peaks_path, "ab") as f:
+            for i in range(0, count, step):
+                chunk = prev[i:i + step]
+                starts = np.arange(0, len(chunk), PEAK_LEVEL_FACTOR)
+                f.write(np.column_stack(
+                    (np.minimum.reduceat(chunk[:, 0], starts), np.maximum.reduceat(chunk[:, 1], starts))
+                ).tobytes())
+        del prev
+        levels.append((block * PEAK_LEVEL_FACTOR, offset + count, -(-count // PEAK_LEVEL_FACTOR)))
+    return levels
+
+
+def load_source_audio(path, whisper_sr=16000):
+    """Decode `path` once into the cache (or reuse it) and memory-map it."""
+    digest = file_digest(path)
+    cache_dirs = _cache_dirs(path)
+    for cache_dir in cache_dirs:
+        base = os.path.join(cache_dir, digest)
+        if not os.path.exists(base + ".json"):
+            continue
+        try:
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("whisper_sr") == whisper_sr:
+                return SourceAudio(path, digest, meta, base, whisper_sr)
+        except Exception as e:
+            print(f"[CACHE] Ignoring unreadable cache for {os.path.basename(path)}: {e}")
+
+    cache_dir = next((d for d in cache_dirs if _writable_dir(d)), None)
+    if cache_dir is None:
+        raise PermissionError(f"No writable decode cache for {path}: tried {', '.join(cache_dirs)}")
+    if cache_dir != cache_dirs[0]:
+        print(f"[CACHE] {os.path.dirname(os.path.abspath(path))} is read-only; caching in {cache_dir}")
+    base = os.path.join(cache_dir, digest)
+    meta_path = base + ".json"
+    with TRACE.span("decode", file=os.path.basename(path)) as span:
+        meta = _decode_to_cache(path, base, whisper_sr)
+        span.set(frames=meta["frames"], frame_rate=meta["frame_rate"])
+    meta["whisper_sr"] = whisper_sr
+    # The meta file is written last and marks the cache as complete
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+    source = SourceAudio(path, digest, meta, base, whisper_sr)
+    source.cached = False
+    return source
+
+
+class WhisperModelRegistry:
+    """Process-wide cache of loaded WhisperModel instances.
+
+    Each (size, compute_type, device, options) combination is loaded once and
+    kept resident; the least recently used models are dropped once the
+    estimated footprint goes over `max_mb`.
+    """
+
+    def __init__(self, max_mb=WHISPER_CACHE_MB):
+        self.max_mb = max_mb
+        self._models = OrderedDict()  # key -> (model, estimated_mb)
+        self._loading = {}  # key -> threading.Event
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_mb(size, compute_type):
+        base = WHISPER_MODEL_MB.get(size, WHISPER_MODEL_MB["large-v3"])
+        return base * WHISPER_COMPUTE_SCALE.get(compute_type, 1.0)
+
+    def get(self, size=WHISPER_MODEL_SIZE, compute_type=WHISPER_COMPUTE_TYPE,
+            device=WHISPER_DEVICE, **options):
+        key = (size, compute_type, device, tuple(sorted(options.items())))
+        while True:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key][0]
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = self._loading[key] = threading.Event()
+                    break
+            # Another thread is loading the same model; wait and reuse it
+            pending.wait()
+
+        try:
+            t0 = time.time()
+            with TRACE.span("model_load", size=size, compute_type=compute_type, device=device):
+                model = WhisperModel(size, device=device, compute_type=compute_type, **options)
+            print(f"[MODEL] Loaded whisper '{size}' ({compute_type}, {device}) in {time.time() - t0:0.2f}s")
+            with self._lock:
+                self._models[key] = (model, self.estimate_mb(size, compute_type))
+                self._evict()
+            return model
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set()
+
+    def preload(self, size=WHISPER_MODEL_SIZE, compute_type=WHISPER_COMPUTE_TYPE,
+                device=WHISPER_DEVICE, **options):
+        """Load a model in a background thread so the first transcription starts warm."""
+        def _run():
+            try:
+                self.get(size, compute_type, device, **options)
+            except Exception as e:
+                print(f"[MODEL] Preload failed: {e}")
+
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        return thread
+
+    def _evict(self):
+        total = sum(mb for _, mb in self._models.values())
+        while total > self.max_mb and len(self._models) > 1:
+            key, (_, mb) = self._models.popitem(last=False)
+            total -= mb
+            print(f"[MODEL] Evicted whisper '{key[0]}' ({key[1]}, {key[2]})")
+
+
+WHISPER_MODELS = WhisperModelRegistry()
+
+
+# -------------------- Word interval index --------------------
+class WordIntervalIndex:
+    """Word intervals sorted by start, with a running max of the ends.
+
+    `overlapping(t0, t1)` bisects the sorted starts for the right edge and the
+    running max for the left edge, so hit-testing and culling cost
+    O(log n + k). `update` re-positions a single word after a margin change.
+    """
+
+    def __init__(self):
+        self.rebuild(np.zeros(0), np.zeros(0))
+
+    def __len__(self):
+        return len(self.order)
+
+    def rebuild(self, starts, ends):
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        self.order = np.argsort(starts, kind="stable")
+        self.starts = starts[self.order]
+        self.ends = ends[self.order]
+        self.pos = np.empty_like(self.order)
+        self.pos[self.order] = np.arange(len(self.order))
+        self.max_end = np.maximum.accumulate(self.ends) if len(self.ends) else self.ends.copy()
+
+    def update(self, i, start, end):
+        p = old = int(self.pos[i])
+        self.starts[p], self.ends[p] = start, end
+        n = len(self.order)
+        # Margin nudges move a word past a few neighbours at most
+        while p > 0 and self.starts[p - 1] > self.starts[p]:
+            self._swap(p - 1, p)
+            p -= 1
+        while p < n - 1 and self.starts[p + 1] < self.starts[p]:
+            self._swap(p, p + 1)
+            p += 1
+        lo = min(p, old)
+        tail = np.maximum.accumulate(self.ends[lo:])
+        if lo > 0:
+            np.maximum(tail, self.max_end[lo - 1], out=tail)
+        self.max_end[lo:] = tail
+
+    def _swap(self, a, b):
+        for arr in (self.starts, self.ends, self.order):
+            arr[a], arr[b] = arr[b], arr[a]
+        self.pos[self.order[a]] = a
+        self.pos[self.order[b]] = b
+
+    def overlapping(self, t0, t1):
+        """Indices of words whose [start, end] intersects [t0, t1], in start order."""
+        hi = int(np.searchsorted(self.starts, t1, side="right"))
+        lo = int(np.searchsorted(self.max_end, t0, side="left"))
+        if lo >= hi:
+            return self.order[:0]
+        keep = self.ends[lo:hi] >= t0
+        return self.order[lo:hi][keep]
+
+
+# -------------------- Timeline rendering --------------------
+class TimelineRenderer:
+    """Retained-mode timeline on a matplotlib Axes.
+
+    `draw_static` renders what only changes with the view or the word table
+    (waveform, ruler, inactive word markers); the canvas background is cached
+    on every full draw. Playhead, selection and current-word markers are
+    animated artists that `blit` repaints on top of that cache.
+    """
+
+    def __init__(self, fig, ax, canvas):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.background = None
+        self.overlay = []
+        self.start_norm, self.end_norm, self.n_points = 0.0, 1.0, 1
+        self.total_ms = 0.0
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    # --- coordinates ---
+    def norm_to_x(self, norm, clip=True):
+        if self.end_norm > self.start_norm:
+            rel = (np.asarray(norm, dtype=np.float64) - self.start_norm) / (self.end_norm - self.start_norm)
+        else:
+            rel = np.zeros_like(np.asarray(norm, dtype=np.float64))
+        if clip:
+            rel = np.clip(rel, 0.0, 1.0)
+        return rel * (self.n_points - 1)
+
+    def ms_to_x(self, ms, clip=True):
+        if self.total_ms <= 0:
+            return np.zeros_like(np.asarray(ms, dtype=np.float64))
+        return self.norm_to_x(np.asarray(ms, dtype=np.float64) / self.total_ms, clip)
+
+    # --- static layers ---
+    def clear(self):
+        self.ax.clear()
+        self.ax.axis("off")
+        self.overlay = []
+        self.canvas.draw()
+
+    def draw_static(self, peaks, start_norm, end_norm, n_bins, total_ms, starts_ms, ends_ms):
+        ax = self.ax
+        ax.clear()
+        self.start_norm, self.end_norm, self.total_ms = start_norm, end_norm, total_ms
+
+        start_idx = int(start_norm * peaks.length)
+        end_idx = max(start_idx + 1, int(end_norm * peaks.length))
+        # One min/max pair per pixel column, straight from the pyramid
+        mins, maxs = peaks.query(start_idx, end_idx, n_bins)
+        self.n_points = max(1, len(mins))
+        ax.fill_between(
+            np.arange(len(mins)),
+            mins,
+            maxs,
+            color=TIMELINE_AUDIO,
+            linewidth=WAVEFORM_STROKE,
+            alpha=0.9
+        )
+        ax.set_xlim(0, self.n_points - 1)
+
+        # Inactive word markers as one collection, culled to the view
+        if len(starts_ms):
+            sx = self.ms_to_x(starts_ms, clip=False)
+            ex = self.ms_to_x(ends_ms, clip=False)
+            last = self.n_points - 1
+            xs = np.concatenate((sx[(sx >= 0) & (sx <= last)], ex[(ex >= 0) & (ex <= last)]))
+            if len(xs):
+                ax.vlines(xs, 0, 1, transform=ax.get_xaxis_transform(),
+                          colors="#444444", lw=0.8, alpha=0.7)
+
+        self._draw_ruler()
+        ax.axis("off")
+
+        # Overlay artists (excluded from the cached background)
+        xform = ax.get_xaxis_transform()
+        self.sel_span = Rectangle((0, 0), 0, 1, transform=xform, color="#333333",
+                                  alpha=0.25, animated=True)
+        ax.add_patch(self.sel_span)
+        self.sel_start_line = ax.axvline(0, color=COLOR_SUCCESS, lw=1.5, animated=True)   # green start
+        self.sel_end_line = ax.axvline(0, color=ACCENT_PURPLE, lw=1.5, animated=True)     # purple end
+        self.word_start_line = ax.axvline(0, color=COLOR_MARGINAL, lw=0.8, alpha=0.7, animated=True)
+        self.word_end_line = ax.axvline(0, color=COLOR_MARGINAL, lw=0.8, alpha=0.7, animated=True)
+        self.playhead_line = ax.axvline(0, color=TIMELINE_CLICK, lw=1.5, animated=True)
+        self.overlay = [
+            self.sel_span, self.sel_start_line, self.sel_end_line,
+            self.word_start_line, self.word_end_line, self.playhead_line,
+        ]
+
+    def _draw_ruler(self):
+        if self.total_ms <= 0:
+            return
+
+        total_sec = self.total_ms / 1000.0
+        start_sec = self.start_norm * total_sec
+        end_sec = self.end_norm * total_sec
+        span_sec = max(end_sec - start_sec, 1e-6)
+
+        rough_step = span_sec / 8.0
+        mag = 10 ** int(np.floor(np.log10(rough_step)))
+        norm = rough_step / mag
+        if norm < 1.5:
+            step = 1 * mag
+        elif norm < 3:
+            step = 2 * mag
+        elif norm < 7:
+            step = 5 * mag
+        else:
+            step = 10 * mag
+
+        sec = np.floor(start_sec / step) * step
+        while sec <= end_sec + 1e-6:
+            t_norm = sec / total_sec
+            x_frac = float(self.norm_to_x(t_norm)) / max(1, self.n_points - 1)
+            pct = t_norm * 100.0
+            label = f"{sec:0.1f}s | {pct:0.0f}%"
+
+            self.ax.text(
+                x_frac,
+                -0.15,
+                label,
+                transform=self.ax.transAxes,
+                ha="center",
+                va="top",
+                fontsize=8,
+                color="#AAAAAA"
+            )
+            sec += step
+
+    # --- overlay ---
+    def set_overlay(self, playhead_norm, sel_ms, current_ms=None):
+        if not self.overlay:
+            return
+        s_val = max(0.0, min(self.total_ms, sel_ms[0]))
+        e_val = max(s_val, min(self.total_ms, sel_ms[1]))
+        s_x, e_x = float(self.ms_to_x(s_val)), float(self.ms_to_x(e_val))
+        self.sel_span.set_x(s_x)
+        self.sel_span.set_width(e_x - s_x)
+        self.sel_start_line.set_xdata([s_x, s_x])
+        self.sel_end_line.set_xdata([e_x, e_x])
+
+        last = self.n_points - 1
+        for line, ms in zip((self.word_start_line, self.word_end_line), current_ms or (None, None)):
+            x = None if ms is None else float(self.ms_to_x(ms, clip=False))
+            line.set_visible(x is not None and 0 <= x <= last)
+            if line.get_visible():
+                line.set_xdata([x, x])
+
+        ph_x = float(self.norm_to_x(playhead_norm))
+        self.playhead_line.set_xdata([ph_x, ph_x])
+
+    def draw(self):
+        self.canvas.draw()
+
+    def _on_draw(self, _event):
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_overlay()
+
+    def _draw_overlay(self):
+        for artist in self.overlay:
+            if artist.axes is self.ax:
+                self.ax.draw_artist(artist)
+
+    def blit(self):
+        """Repaint only the overlay artists over the cached background."""
+        if self.background is None or not self.overlay:
+            self.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_overlay()
+        self.canvas.blit(self.fig.bbox)
+
+
+# -------------------- Playback --------------------
+class PcmPlayer:
+    """Plays frame ranges of the decoded PCM buffer through a callback stream.
+
+    The stream stays open while a file is loaded and outputs silence when
+    idle, so starting playback is just moving the read cursor. `play` can
+    also take a float buffer prepared ahead of time for that range, which
+    the callback copies out without touching the memory-mapped source.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stream = None
+        self._pcm = None
+        self._scale = 1.0
+        self._buffer = None
+        self._buffer_start = 0
+        self._requested_ns = None
+        # (ms, from prepared buffer) of the last start, written by the callback
+        self.start_latency = None
+        self._pos = 0
+        self._end = 0
+        self._rate = 1
+        # Device clock: frame index that reaches the DAC at `_clock_dac_time`
+        self._clock_frame = 0
+        self._clock_dac_time = None
+
+    def set_source(self, pcm, frame_rate, sample_width):
+        self.close()
+        with self._lock:
+            self._pcm = pcm
+            self._rate = frame_rate
+            self._scale = 1.0 / float(1 << (8 * sample_width - 1))
+            self._buffer = None
+            self._pos = self._end = 0
+            self._clock_frame = 0
+            self._clock_dac_time = None
+        if sd is None:
+            return
+        self._stream = sd.OutputStream(
+            samplerate=frame_rate,
+            channels=pcm.shape[1],
+            dtype="float32",
+            latency=PLAYBACK_LATENCY,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def play(self, start_frame, end_frame, buffer=None):
+        """Play source frames [start_frame, end_frame).
+
+        `buffer`, if given, is `pcm_to_float` of exactly that range.
+        """
+        with self._lock:
+            if self._pcm is None:
+                return
+            n = len(self._pcm)
+            self._pos = max(0, min(n, int(start_frame)))
+            self._end = max(self._pos, min(n, int(end_frame)))
+            if buffer is not None and len(buffer) >= self._end - self._pos:
+                self._buffer, self._buffer_start = buffer, self._pos
+            else:
+                self._buffer = None
+            self._requested_ns = time.perf_counter_ns()
+            self._clock_frame = self._pos
+            self._clock_dac_time = None
+
+    def stop(self):
+        with self._lock:
+            self._end = self._pos
+            self._clock_frame = self._pos
+            self._clock_dac_time = None
+
+    @property
+    def total_frames(self):
+        return len(self._pcm) if self._pcm is not None else 0
+
+    @property
+    def active(self):
+        """True while queued frames remain or are still on their way to the DAC."""
+        return self._pos < self._end or self.position() < self._end
+
+    def position(self):
+        """Frame index currently audible, read from the device's output clock."""
+        with self._lock:
+            if self._clock_dac_time is None or self._stream is None:
+                return self._clock_frame
+            elapsed = max(0.0, self._stream.time - self._clock_dac_time)
+            return min(self._end, self._clock_frame + int(elapsed * self._rate))
+
+    def _callback(self, outdata, frames, time_info, _status):
+        requested = None
+        with self._lock:
+            n = min(frames, self._end - self._pos)
+            if n > 0:
+                buffer = self._buffer
+                if buffer is not None:
+                    at = self._pos - self._buffer_start
+                    chunk = buffer[at:at + n]
+                else:
+                    chunk = self._pcm[self._pos:self._pos + n]
+                if self._clock_dac_time is None:
+                    self._clock_frame = self._pos
+                    self._clock_dac_time = time_info.outputBufferDacTime
+                    requested, self._requested_ns = self._requested_ns, None
+                self._pos += n
+        if n > 0:
+            if buffer is not None:
+                outdata[:n] = chunk
+            else:
+                np.multiply(chunk, self._scale, out=outdata[:n], casting="unsafe")
+            outdata[n:] = 0
+        else:
+            outdata.fill(0)
+        if requested is not None and TRACE.enabled:
+            # Request -> first block queued, plus that block's wait for the DAC.
+            # Only stored here: emitting (lock, file I/O) is left to the Tk thread.
+            queued_ms = (time.perf_counter_ns() - requested) / 1e6
+            dac_ms = (time_info.outputBufferDacTime - time_info.currentTime) * 1000.0
+            self.start_latency = (queued_ms + dac_ms, buffer is not None)
+
+    def take_start_latency(self):
+        """Return the last recorded start latency once, then None."""
+        latency, self.start_latency = self.start_latency, None
+        return latency
+
+
+# -------------------- Export --------------------
+def write_clip(path, pcm, frame_rate, fmt="wav"):
+    """Write a (frames, channels) slice of the PCM buffer as WAV/FLAC/OGG."""
+    if pcm.dtype == np.int8:
+        pcm = pcm.astype(np.int16) << 8
+    wide = pcm.dtype.itemsize > 2
+    subtype = {
+        "wav": "PCM_32" if wide else "PCM_16",
+        "flac": "PCM_24" if wide else "PCM_16",
+        "ogg": "VORBIS",
+    }[fmt]
+    with TRACE.span("export", fmt=fmt, frames=len(pcm)):
+        sf.write(path, pcm, frame_rate, format=fmt.upper(), subtype=subtype)
+
+
+class ExportPool:
+    """Background clip writer for approvals.
+
+    `submit` hands a view of the shared PCM buffer to a worker thread and
+    returns at once (libsndfile releases the GIL while encoding). Finished
+    jobs are collected with `drain()` on the Tk thread, which writes the
+    project rows for a whole batch in one transaction.
+    """
+
+    def __init__(self, workers=EXPORT_WORKERS):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export")
+        self.done = queue.Queue()
+        self.pending = 0
+
+    def submit(self, key, word, path, pcm, frame_rate, fmt):
+        self.pending += 1
+        future = self.pool.submit(write_clip, path, pcm, frame_rate, fmt)
+        future.add_done_callback(lambda f: self.done.put((key, word, f.exception())))
+
+    def drain(self):
+        """Return [(key, word, error)] for every job finished since the last call."""
+        out = []
+        while True:
+            try:
+                out.append(self.done.get_nowait())
+            except queue.Empty:
+                break
+        self.pending -= len(out)
+        return out
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
+
+
+# -------------------- Transcription helpers --------------------
+def make_word(text, start_ms, end_ms, probability=1.0):
+    return {
+        "word": text,
+        "start_ms": start_ms,
+        "end_ms": end_ms,
+        "m_start": 0.0,
+        "m_end": 0.0,
+        "g_start": 0.0,
+        "g_end": 0.0,
+        "export_path": "",
+        "probability": probability,
+    }
+
+
+def effective_ms(w, g_start=None, g_end=None):
+    # effective = base times + global + local. The global margins are a
+    # project-level value applied here; rows only carry the snapshot taken
+    # when they were exported, which is used when no globals are passed.
+    if g_start is None:
+        g_start = w.get("g_start", 0.0)
+    if g_end is None:
+        g_end = w.get("g_end", 0.0)
+    s = w["start_ms"] + (g_start + w.get("m_start", 0.0)) * 1000.0
+    e = w["end_ms"] + (g_end + w.get("m_end", 0.0)) * 1000.0
+    return max(0.0, s), max(0.0, e)
+
+
+def local_ms(w):
+    """Base times plus local margins only, unclamped (what the index stores)."""
+    return (w["start_ms"] + w.get("m_start", 0.0) * 1000.0,
+            w["end_ms"] + w.get("m_end", 0.0) * 1000.0)
+
+
+def nudge_seconds(value, delta):
+    """Add `delta` to a margin in whole milliseconds so repeated nudges never drift."""
+    return (round(value * 1000.0) + round(delta * 1000.0)) / 1000.0
+
+
+def clean_word(text):
+    return "".join(x for x in text if x.isalnum())
+
+
+def _is_float(text):
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def parse_cut_template_line(line):
+    """Parse one cutTemplate.txt line into a word dict (None if unusable).
+
+    Format: word,start_ms,end_ms,global_m_start,global_m_end,local_m_start,
+    local_m_end,export_path; legacy lines are word,start_ms,end_ms,export_path.
+    Names and paths may themselves contain commas, so the numeric run is
+    located first and everything around it is rejoined.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    parts = line.split(",")
+    for run in (6, 2):
+        for i in range(1, len(parts) - run + 1):
+            nums = parts[i:i + run]
+            if not all(_is_float(x) for x in nums):
+                continue
+            nums = [float(x) for x in nums] + [0.0] * (6 - run)
+            w = make_word(",".join(parts[:i]), nums[0], nums[1])
+            w["g_start"], w["g_end"], w["m_start"], w["m_end"] = nums[2:6]
+            w["export_name"] = w["word"]
+            w["export_path"] = ",".join(parts[i + run:])
+            return w
+    return None
+
+
+# -------------------- Word table --------------------
+class StringPool:
+    """Interned strings; columns store int32 codes instead of str objects."""
+
+    def __init__(self):
+        self.strings = [""]
+        self.codes = {"": 0}
+
+    def __len__(self):
+        return len(self.strings)
+
+    def code(self, text):
+        c = self.codes.get(text)
+        if c is None:
+            c = self.codes[text] = len(self.strings)
+            self.strings.append(text)
+        return c
+
+
+class WordRow:
+    """Dict-like view of one WordTable row; writes go straight to the columns."""
+
+    __slots__ = ("table", "i")
+
+    def __init__(self, table, i):
+        self.table, self.i = table, i
+
+    def __getitem__(self, key):
+        return self.table.get(self.i, key)
+
+    def __setitem__(self, key, value):
+        self.table.set(self.i, key, value)
+
+    def __contains__(self, key):
+        return key in WordTable.KEYS
+
+    def get(self, key, default=None):
+        return self.table.get(self.i, key) if key in WordTable.KEYS else default
+
+    def keys(self):
+        return WordTable.KEYS
+
+    def to_dict(self):
+        return {k: self.table.get(self.i, k) for k in WordTable.KEYS}
+
+
+class WordTable:
+    """Struct-of-arrays word store: one NumPy column per numeric field and
+    string-pool codes for the text fields.
+
+    Indexing returns a `WordRow`, so code written against word dicts keeps
+    working, while redraws use the vectorized `effective_starts` /
+    `effective_ends`.
+    """
+
+    NUMERIC = ("start_ms", "end_ms", "m_start", "m_end", "g_start", "g_end", "probability")
+    TEXT = ("word", "export_name", "export_path")
+    KEYS = ("id",) + NUMERIC + TEXT
+    DEFAULTS = {"probability": 1.0}
+
+    def __init__(self, capacity=1024):
+        self.n = 0
+        self.pool = StringPool()
+        self.cols = {k: np.zeros(capacity, dtype=np.float64) for k in self.NUMERIC}
+        self.cols.update({k: np.zeros(capacity, dtype=np.int32) for k in self.TEXT})
+        self.cols["id"] = np.full(capacity, -1, dtype=np.int64)
+
+    @classmethod
+    def from_dicts(cls, words):
+        table = cls(max(1024, len(words)))
+        table.extend(words)
+        return table
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if not -self.n <= i < self.n:
+            raise IndexError(i)
+        return WordRow(self, i % self.n)
+
+    def __iter__(self):
+        return (WordRow(self, i) for i in range(self.n))
+
+    def column(self, key):
+        return self.cols[key][:self.n]
+
+    def get(self, i, key):
+        v = self.cols[key][i]
+        if key in self.TEXT:
+            return self.pool.strings[v]
+        if key == "id":
+            return int(v) if v >= 0 else None
+        return float(v)
+
+    def set(self, i, key, value):
+        if key in self.TEXT:
+            value = self.pool.code(value or "")
+        elif key == "id" and value is None:
+            value = -1
+        self.cols[key][i] = value
+
+    def _reserve(self, n):
+        cap = len(self.cols["id"])
+        if n <= cap:
+            return
+        cap = max(n, cap * 2)
+        for k, col in self.cols.items():
+            grown = np.full(cap, -1 if k == "id" else 0, dtype=col.dtype)
+            grown[:self.n] = col[:self.n]
+            self.cols[k] = grown
+
+    def extend(self, words):
+        words = list(words)
+        self._reserve(self.n + len(words))
+        lo, hi = self.n, self.n + len(words)
+        for k in self.NUMERIC:
+            d = self.DEFAULTS.get(k, 0.0)
+            self.cols[k][lo:hi] = [w.get(k, d) for w in words]
+        for k in self.TEXT:
+            self.cols[k][lo:hi] = [self.pool.code(w.get(k) or "") for w in words]
+        self.cols["id"][lo:hi] = [-1 if w.get("id") is None else w["id"] for w in words]
+        self.n = hi
+
+    def append(self, w):
+        self.extend((w,))
+
+    def local_starts(self, idx=slice(None)):
+        return self.column("start_ms")[idx] + self.column("m_start")[idx] * 1000.0
+
+    def local_ends(self, idx=slice(None)):
+        return self.column("end_ms")[idx] + self.column("m_end")[idx] * 1000.0
+
+    def effective_starts(self, g_start=None, idx=slice(None)):
+        """Vectorized `effective_ms` starts; rows' own g_start when g_start is None."""
+        g = self.column("g_start")[idx] if g_start is None else g_start
+        return np.maximum(0.0, self.local_starts(idx) + g * 1000.0)
+
+    def effective_ends(self, g_end=None, idx=slice(None)):
+        g = self.column("g_end")[idx] if g_end is None else g_end
+        return np.maximum(0.0, self.local_ends(idx) + g * 1000.0)
+
+
+class ProjectStore:
+    """SQLite project file: source hash, word table, margins and exports.
+
+    Words are indexed by start time; the Tk side keeps them in a
+    `WordTable` and writes rows back incrementally through `upsert_word`,
+    keyed by the row id.
+    """
+
+    COLUMNS = ("word", "start_ms", "end_ms", "g_start", "g_end",
+               "m_start", "m_end", "probability", "export_name", "export_path")
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS words (
+                id INTEGER PRIMARY KEY,
+                word TEXT NOT NULL,
+                start_ms REAL NOT NULL,
+                end_ms REAL NOT NULL,
+                g_start REAL NOT NULL DEFAULT 0,
+                g_end REAL NOT NULL DEFAULT 0,
+                m_start REAL NOT NULL DEFAULT 0,
+                m_end REAL NOT NULL DEFAULT 0,
+                probability REAL NOT NULL DEFAULT 1,
+                export_name TEXT NOT NULL DEFAULT '',
+                export_path TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS words_by_time ON words(start_ms);
+            DROP INDEX IF EXISTS words_by_text;
+            """
+        )
+        self.db.commit()
+
+    def close(self):
+        with self._lock:
+            self.db.close()
+
+    # --- meta ---
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self.db.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, **values):
+        with self._lock, self.db:
+            self.db.executemany(
+                "INSERT INTO meta(key, value) VALUES(?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                [(k, str(v)) for k, v in values.items()],
+            )
+
+    def set_source(self, source):
+        self.set_meta(source_path=os.path.abspath(source.path), source_digest=source.digest)
+
+    # --- words ---
+    def _row_to_word(self, row):
+        w = dict(zip(("id",) + self.COLUMNS, row))
+        if not w["export_name"]:
+            del w["export_name"]
+        return w
+
+    def _values(self, w):
+        return (
+            w["word"], w["start_ms"], w["end_ms"],
+            w.get("g_start", 0.0), w.get("g_end", 0.0),
+            w.get("m_start", 0.0), w.get("m_end", 0.0),
+            w.get("probability", 1.0),
+            w.get("export_name", ""), w.get("export_path", ""),
+        )
+
+    def count(self):
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+
+    def load_words(self):
+        """All words as a WordTable, filled in batches so no dict list is built."""
+        cols = ", ".join(("id",) + self.COLUMNS)
+        with self._lock:
+            table = WordTable(max(1024, self.db.execute("SELECT COUNT(*) FROM words").fetchone()[0]))
+            cur = self.db.execute(f"SELECT {cols} FROM words ORDER BY start_ms, id")
+            while rows := cur.fetchmany(4096):
+                table.extend(self._row_to_word(r) for r in rows)
+        return table
+
+    def words_between(self, start_ms, end_ms, exported_only=False):
+        """Words whose base start lies in [start_ms, end_ms] (index range scan)."""
+        cols = ", ".join(("id",) + self.COLUMNS)
+        sql = f"SELECT {cols} FROM words WHERE start_ms BETWEEN ? AND ?"
+        if exported_only:
+            sql += " AND export_path != ''"
+        with self._lock:
+            rows = self.db.execute(sql + " ORDER BY start_ms", (start_ms, end_ms)).fetchall()
+        return [self._row_to_word(r) for r in rows]
+
+    def upsert_word(self, w):
+        with self._lock, self.db:
+            self._upsert(w)
+
+    def upsert_words(self, words):
+        """Write many rows in a single transaction (one commit per batch)."""
+        with self._lock, self.db:
+            for w in words:
+                self._upsert(w)
+
+    def _upsert(self, w):
+        if w.get("id") is not None:
+            sets = ", ".join(f"{c}=?" for c in self.COLUMNS)
+            self.db.execute(f"UPDATE words SET {sets} WHERE id=?", self._values(w) + (w["id"],))
+        else:
+            marks = ", ".join("?" for _ in self.COLUMNS)
+            cur = self.db.execute(
+                f"INSERT INTO words({', '.join(self.COLUMNS)}) VALUES({marks})", self._values(w)
+            )
+            w["id"] = cur.lastrowid
+
+    def clear_range(self, start_ms, end_ms):
+        """Drop words in a range that is about to be re-transcribed; exported words stay."""
+        with self._lock, self.db:
+            self.db.execute(
+                "DELETE FROM words WHERE start_ms BETWEEN ? AND ? AND export_path=''",
+                (start_ms, end_ms),
+            )
+
+    def add_words(self, words):
+        """Insert freshly transcribed words in one transaction.
+
+        A new word that overlaps an already exported word with the same text
+        adopts that row (id, margins, export) instead of duplicating it.
+        """
+        if not words:
+            return
+        lo = min(w["start_ms"] for w in words) - 1000.0
+        hi = max(w["end_ms"] for w in words)
+        exported = {}
+        for row in self.words_between(lo, hi, exported_only=True):
+            exported.setdefault(clean_word(row["word"]).lower(), []).append(row)
+
+        with self._lock, self.db:
+            for w in words:
+                match = None
+                for row in exported.get(clean_word(w["word"]).lower(), ()):
+                    if row["start_ms"] < w["end_ms"] and w["start_ms"] < row["end_ms"]:
+                        match = row
+                        break
+                if match is not None:
+                    w.update(match)
+                else:
+                    w.pop("id", None)
+                    self._upsert(w)
+
+    def clear(self):
+        with self._lock, self.db:
+            self.db.execute("DELETE FROM words")
+            self.db.execute("DELETE FROM meta")
+
+    def import_cut_template(self, path):
+        """Import a legacy cutTemplate.txt; returns the number of entries added."""
+        with open(path, "r", encoding="utf-8") as f:
+            entries = [w for w in map(parse_cut_template_line, f) if w is not None]
+        with self._lock, self.db:
+            for w in entries:
+                self._upsert(w)
+        return len(entries)
+
+
+def transcribe_words(model, audio, sr, offset_ms=0.0, vad=False):
+    """Yield word dicts for 16 kHz mono `audio`, with times shifted by offset_ms.
+
+    With `vad`, silence is cut out before decoding (a silent input costs only
+    the VAD pass); faster-whisper restores the original timestamps.
+    """
+    segments, _ = model.transcribe(
+        audio,
+        language=WHISPER_LANGUAGE,
+        beam_size=WHISPER_BEAM_SIZE,
+        word_timestamps=True,
+        vad_filter=vad,
+        vad_parameters=VAD_PARAMETERS if vad else None,
+    )
+    # Segments are decoded lazily, so the model time is spent in `next`
+    segments = iter(segments)
+    while True:
+        with TRACE.span("whisper_decode"):
+            seg = next(segments, None)
+        if seg is None:
+            return
+        with TRACE.span("word_extraction", words=len(seg.words)):
+            words = [
+                make_word(
+                    w.word.strip(),
+                    offset_ms + float(w.start) * 1000.0,
+                    offset_ms + float(w.end) * 1000.0,
+                    float(getattr(w, "probability", 1.0)),
+                )
+                for w in seg.words if w.word.strip()
+            ]
+        yield from words
+
+
+def frame_energy(audio, sr, frame_ms=SILENCE_FRAME_MS):
+    """RMS energy per frame of `frame_ms` milliseconds."""
+    frame = max(1, int(sr * frame_ms / 1000))
+    n = len(audio) // frame
+    if n == 0:
+        return np.zeros(0, dtype=np.float32), frame
+    frames = audio[:n * frame].reshape(n, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1)), frame
+
+
+class ChunkGrid:
+    """File-global chunk boundaries at the quietest frame near every CHUNK_TARGET_S.
+
+    Boundaries depend only on the audio, so every selection over a file is
+    split into the same chunks and overlapping selections share cached
+    transcripts. Cuts are extended lazily from the start of the file and
+    only the search windows are read.
+    """
+
+    def __init__(self, audio, sr, target_s=CHUNK_TARGET_S, search_s=CHUNK_SEARCH_S,
+                 overlap_s=CHUNK_OVERLAP_S):
+        self.audio = audio
+        self.sr = sr
+        self.target = int(target_s * sr)
+        self.search = int(search_s * sr)
+        self.overlap = int(overlap_s * sr)
+        self.frame = max(1, int(sr * SILENCE_FRAME_MS / 1000))
+        self.cuts = [0]
+
+    def _extend(self, upto):
+        n, frame = len(self.audio), self.frame
+        while self.cuts[-1] < min(upto, n):
+            pos = self.cuts[-1] + self.target
+            if pos >= n - self.target // 2:
+                self.cuts.append(n)
+                break
+            lo = max(self.cuts[-1] + 1, pos - self.search) // frame
+            hi = min(n, pos + self.search) // frame
+            energy, _ = frame_energy(self.audio[lo * frame:hi * frame], self.sr)
+            if len(energy):
+                self.cuts.append((lo + int(np.argmin(energy))) * frame + frame // 2)
+            else:
+                self.cuts.append(pos)
+
+    def chunks(self, start, end):
+        """(own_start, own_end, start, end) sample indices of the chunks meeting [start, end).
+
+        Words whose midpoint falls in [own_start, own_end) belong to that
+        chunk, while [start, end) is what is actually sent to the model.
+        """
+        self._extend(end)
+        n = len(self.audio)
+        out = []
+        for a, b in zip(self.cuts[:-1], self.cuts[1:]):
+            if b <= start:
+                continue
+            if a >= end:
+                break
+            out.append((a, b, max(0, a - self.overlap), min(n, b + self.overlap)))
+        return out
+
+
+def transcribe_settings(vad=False):
+    """Everything besides the audio that changes Whisper's output."""
+    return {
+        "model": WHISPER_MODEL_SIZE,
+        "compute_type": WHISPER_COMPUTE_TYPE,
+        "language": WHISPER_LANGUAGE,
+        "beam_size": WHISPER_BEAM_SIZE,
+        "vad": VAD_PARAMETERS if vad else None,
+        "version": 1,
+    }
+
+
+class TranscriptCache:
+    """On-disk word lists per chunk, keyed by a hash of the chunk's 16 kHz
+    samples and the decode settings."""
+
+    def __init__(self, cache_dir):
+        self.dir = os.path.join(cache_dir, TRANSCRIPT_CACHE_DIR)
+
+    @staticmethod
+    def key(audio, settings):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+        h.update(np.ascontiguousarray(audio, dtype=np.float32).tobytes())
+        return h.hexdigest()
+
+    def get(self, key):
+        """Word dicts relative to the chunk start, or None on a miss."""
+        try:
+            with open(os.path.join(self.dir, key + ".json"), "r", encoding="utf-8") as f:
+                return [make_word(*row) for row in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, key, words):
+        path = os.path.join(self.dir, key + ".json")
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump([[w["word"], w["start_ms"], w["end_ms"], w["probability"]] for w in words], f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"[CACHE] Could not write transcript cache: {e}")
+
+
+def transcribe_range(audio, sr, start, end, grid, cache=None, vad=False, workers=1):
+    """Yield words of samples [start, end) of the whole-file `audio`, in order.
+
+    The range is covered with `grid` chunks so overlapping selections can
+    share cached transcripts, but audio outside the range is only decoded
+    for chunks the range owns completely (their window overlap). A cached
+    grid chunk is always reused; a missing chunk the range only touches is
+    clipped to the range, and a range that owns no whole chunk is decoded as
+    one window. Every decoded window is cached under a hash of its own
+    samples. Decodes use the editor's shared TRANSCRIBE_MODEL_OPTIONS model;
+    with workers > 1 the misses run on up to that many of its ctranslate2
+    workers at once. A word is kept by the chunk that owns its midpoint
+    and only if the midpoint lies inside the range.
+    """
+    settings = transcribe_settings(vad)
+    lo_ms, hi_ms = start * 1000.0 / sr, end * 1000.0 / sr
+
+    def _job(own_s, own_e, w_s, w_e):
+        key = words = None
+        if cache is not None:
+            key = cache.key(audio[w_s:w_e], settings)
+            words = cache.get(key)
+        return own_s, own_e, w_s, w_e, key, words
+
+    jobs = [_job(*chunk) for chunk in grid.chunks(start, end)]
+    if any(job[-1] is None for job in jobs):
+        owned = [start <= own_s and own_e <= end for own_s, own_e, *_ in jobs]
+        if not any(owned):
+            # Shorter than a chunk: decode just the selection
+            jobs = [_job(start, end, start, end)]
+        else:
+            # Missing edge chunks are clipped to the selection
+            jobs = [
+                job if whole or job[-1] is not None
+                else _job(job[0], job[1], max(job[2], start), min(job[3], end))
+                for job, whole in zip(jobs, owned)
+            ]
+
+    def _run(job):
+        own_s, own_e, w_s, w_e, key, words = job
+        if words is None:
+            model = WHISPER_MODELS.get(**TRANSCRIBE_MODEL_OPTIONS)
+            window = audio[w_s:w_e]
+            with TRACE.span("transcribe_chunk", seconds=len(window) / sr):
+                words = list(transcribe_words(model, window, sr, 0.0, vad))
+            if cache:
+                cache.put(key, words)
+        base_ms = w_s * 1000.0 / sr
+        keep_lo = max(lo_ms, own_s * 1000.0 / sr)
+        keep_hi = min(hi_ms, own_e * 1000.0 / sr)
+        out = []
+        for w in words:
+            w["start_ms"] += base_ms
+            w["end_ms"] += base_ms
+            if keep_lo <= (w["start_ms"] + w["end_ms"]) / 2.0 < keep_hi:
+                out.append(w)
+        return out
+
+    if workers > 1 and len(jobs) > 1:
+        # Chunks are yielded in order as soon as each one (and all before it) is done
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk_words in pool.map(_run, jobs):
+                yield from chunk_words
+    else:
+        for job in jobs:
+            yield from _run(job)
+
+
+# -------------------- Waveform peaks --------------------
+class PeakPyramid:
+    """Min/max mipmaps of a mono signal.
+
+    Built once per loaded file; a redraw picks the coarsest level that still
+    has at least one bin per pixel and reduces only the visible bins. Levels
+    may be in-memory arrays or memmapped columns of the decode cache; the raw
+    level is read through `read(start, end)`.
+    """
+
+    def __init__(self, samples):
+        self.length = len(samples)
+        self.read = lambda start, end: samples[start:end]
+        self.levels = []  # (block_size, mins, maxs), finest first
+
+        if self.length == 0:
+            return
+        block = PEAK_BASE_BLOCK
+        starts = np.arange(0, self.length, block)
+        mins = np.minimum.reduceat(samples, starts)
+        maxs = np.maximum.reduceat(samples, starts)
+        self.levels.append((block, mins, maxs))
+        while len(mins) > PEAK_LEVEL_FACTOR:
+            block *= PEAK_LEVEL_FACTOR
+            starts = np.arange(0, len(mins), PEAK_LEVEL_FACTOR)
+            mins = np.minimum.reduceat(mins, starts)
+            maxs = np.maximum.reduceat(maxs, starts)
+            self.levels.append((block, mins, maxs))
+
+    @classmethod
+    def from_levels(cls, length, pairs, levels, read):
+        """Wrap precomputed (min, max) `pairs` laid out as [(block, offset, count)]."""
+        pyramid = cls.__new__(cls)
+        pyramid.length = length
+        pyramid.read = read
+        pyramid.levels = [
+            (block, pairs[offset:offset + count, 0], pairs[offset:offset + count, 1])
+            for block, offset, count in levels
+        ]
+        return pyramid
+
+    def query(self, start, end, n_bins):
+        """Return (mins, maxs) for samples [start, end) in at most n_bins bins."""
+        start = max(0, min(self.length, int(start)))
+        end = max(start, min(self.length, int(end)))
+        span = end - start
+        if span == 0:
+            empty = np.zeros(0, dtype=np.float32)
+            return empty, empty
+
+        n_bins = max(1, min(int(n_bins), span))
+        per_bin = span / n_bins
+
+        block, level = 1, None
+        for lvl in self.levels:
+            if lvl[0] > per_bin:
+                break
+            block, level = lvl[0], lvl
+
+        lo = start // block
+        hi = max(lo + 1, -(-end // block))
+        if level is None:
+            mins = maxs = self.read(lo, hi)
+        else:
+            mins, maxs = level[1][lo:hi], level[2][lo:hi]
+        edges = (np.arange(n_bins) * ((hi - lo) / n_bins)).astype(np.int64)
+        return (
+            np.minimum.reduceat(mins, edges),
+            np.maximum.reduceat(maxs, edges),
+        )
+
+
+def thumbnail_coords(peaks, start, end, width, height):
+    """Canvas polygon (x0, y0, x1, y1, ...) of the min/max envelope of frames
+    [start, end), scaled to the word's own peak like the old autoscaled plot."""
+    mins, maxs = peaks.query(start, end, width)
+    if len(mins) == 0:
+        return []
+    if len(mins) == 1:
+        mins, maxs = np.repeat(mins, 2), np.repeat(maxs, 2)
+    xs = np.linspace(0.0, width - 1.0, len(mins))
+    peak = max(float(np.max(np.abs(mins))), float(np.max(np.abs(maxs))), 1e-6)
+    scale = (height * 0.45) / peak
+    mid = height / 2.0
+    top = np.column_stack((xs, mid - maxs * scale))
+    bottom = np.column_stack((xs[::-1], mid - mins[::-1] * scale))
+    return np.concatenate((top, bottom)).ravel().tolist()
+
+
+class ThumbnailCache:
+    """LRU of word thumbnail polygons.
+
+    Keys are (word index, start frame, end frame, width, height), so a margin
+    change simply misses. `render` computes on the caller's thread (a pyramid
+    query, well under a millisecond) and is safe to call from the review
+    lookahead thread as well.
+    """
+
+    def __init__(self, capacity=THUMB_CACHE_SIZE):
+        self.capacity = capacity
+        self.peaks = None
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+    def reset(self, peaks):
+        with self._lock:
+            self.peaks = peaks
+            self._items.clear()
+
+    def get(self, key):
+        with self._lock:
+            coords = self._items.get(key)
+            if coords is not None:
+                self._items.move_to_end(key)
+            return coords
+
+    def render(self, key):
+        coords = self.get(key)
+        if coords is None and self.peaks is not None:
+            coords = thumbnail_coords(self.peaks, *key[1:])
+            self._store(self.peaks, key, coords)
+        return coords or []
+
+    def _store(self, peaks, key, coords):
+        with self._lock:
+            if peaks is not self.peaks:
+                return
+            self._items[key] = coords
+            self._items.move_to_end(key)
+            while len(self._items) > self.capacity:
+                self._items.popitem(last=False)
+
+
+# -------------------- Review lookahead --------------------
+def word_labels(w, index, count, g_start, g_end):
+    """Side-panel texts for word `index` of `count` under the given globals."""
+    s_eff, e_eff = effective_ms(w, g_start, g_end)
+    dur = max(0.0, (e_eff - s_eff) / 1000.0)
+    return {
+        "word": f"'{w['word']}'",
+        "index": f"Word {index+1} / {count}",
+        "margins": f"Offsets -> Global: {g_start:+0.3f}s/{g_end:+0.3f}s | "
+                   f"Local: {w.get('m_start', 0.0):+0.3f}s/{w.get('m_end', 0.0):+0.3f}s",
+        "stats": f"Base: {w['start_ms']/1000.0:0.3f}s-{w['end_ms']/1000.0:0.3f}s | "
+                 f"Final duration: {dur:0.3f}s",
+        "export_name": clean_word(w["word"]),
+    }
+
+
+class PreparedWord:
+    __slots__ = ("frames", "buffer", "labels")
+
+    def __init__(self, frames, buffer, labels):
+        self.frames, self.buffer, self.labels = frames, buffer, labels
+
+
+class WordLookahead:
+    """Ready-to-show state for the words around the review cursor.
+
+    `request` replaces the pending jobs with the words the user is about to
+    reach; a daemon thread cuts each one's float playback buffer, formats
+    its labels and renders its thumbnail into the ThumbnailCache. Entries
+    remember the frame range they were cut for, so `get` never returns a
+    stale one, and `invalidate` drops a word (or everything) as soon as its
+    margins change.
+    """
+
+    def __init__(self, thumbnails):
+        self.thumbnails = thumbnails
+        self.source = None
+        self._lock = threading.Lock()
+        self._items = {}
+        self._requests = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def reset(self, source):
+        with self._lock:
+            self.source = source
+            self._items.clear()
+
+    def invalidate(self, i=None):
+        with self._lock:
+            if i is None:
+                self._items.clear()
+            else:
+                self._items.pop(i, None)
+
+    def get(self, i, frames):
+        with self._lock:
+            entry = self._items.get(i)
+        return entry if entry is not None and entry.frames == frames else None
+
+    def request(self, jobs):
+        """Queue `jobs`, (index, frames, row dict, labels args, thumb key)
+        tuples, dropping older requests and entries for other words."""
+        while True:
+            try:
+                self._requests.get_nowait()
+            except queue.Empty:
+                break
+        wanted = {job[0] for job in jobs}
+        with self._lock:
+            for i in [i for i in self._items if i not in wanted]:
+                del self._items[i]
+            source = self.source
+        for job in jobs:
+            self._requests.put((source, job))
+
+    def _run(self):
+        while True:
+            source, (i, frames, row, label_args, thumb_key) = self._requests.get()
+            if source is None or source is not self.source or self.get(i, frames):
+                continue
+            f0, f1 = frames
+            entry = PreparedWord(
+                frames,
+                pcm_to_float(source.pcm[f0:f1], source.sample_width),
+                word_labels(row, i, *label_args),
+            )
+            self.thumbnails.render(thumb_key)
+            with self._lock:
+                if source is self.source:
+                    self._items[i] = entry
+
+
 class BootlegTextSlicer(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -62,20 +1950,31 @@ class BootlegTextSlicer(ctk.CTk):
         self.geometry("2376x980")
         self.configure(fg_color=BG_BLACK)
 
-        # Audio (pydub) + path
-        self.audio_seg: AudioSegment | None = None
+        # Memory-mapped source audio + path
+        self.source: SourceAudio | None = None
         self.audio_path = None
         self.global_avg_dbfs = -20.0
+        self.peaks: PeakPyramid | None = None
+        self.thumbnails = ThumbnailCache()
+        self.lookahead = WordLookahead(self.thumbnails)
 
-        # Numpy audio for Whisper
+        # Numpy audio for Whisper, its file-global chunk grid and transcript cache
         self.audio_np = None
+        self.chunk_grid = None
+        self.transcripts = None
         self.sr = 16000
 
         # Words
-        # Each word dict:
-        # {word, start_ms, end_ms, m_start, m_end, export_path, g_start, g_end}
-        self.words = []
+        # Columnar store; self.words[i] is a dict-like row view with
+        # {id, word, start_ms, end_ms, m_start, m_end, g_start, g_end, export_path, ...}
+        self.words = WordTable()
         self.current_index = 0
+        # Global margins (whole ms), applied at lookup time to every word
+        self.global_start_ms = 0
+        self.global_end_ms = 0
+        # Effective-interval index over self.words, rebuilt lazily when dirty
+        self.word_index = WordIntervalIndex()
+        self._word_index_dirty = True
 
         # Timeline / zoom / playhead
         self.zoom_factor = 1.0
@@ -89,50 +1988,70 @@ class BootlegTextSlicer(ctk.CTk):
         self.sel_start_ms = 0.0
         self.sel_end_ms = 0.0
 
-        # Transcription background
+        # Transcription background (worker -> Tk thread via queue)
         self._transcribe_thread = None
+        self._transcribe_queue = queue.Queue()
+        self._transcribe_poll_id = None
+        self._last_stream_replot = 0.0
+
+        self.player = PcmPlayer()
+        self.pcm = None
 
-        self._play_lock = threading.Lock()
+        # Approved clips are written in the background
+        self.exporter = ExportPool()
+        self._export_poll_id = None
+        self._bulk_export = None
 
-        # Delayed playback handle (for margin adjustments)
+        # Pending margin burst: delayed render/playback handle, whether a
+        # replot is owed and whether the globals still need saving
         self._margin_play_after_id = None
+        self._margins_dirty = False
+        self._global_margins_unsaved = False
 
-        self._init_cut_template()
+        self._init_project()
         self.setup_ui()
         self.setup_bindings()
-
-    # -------------------- CUT TEMPLATE INIT --------------------
-    def _init_cut_template(self):
-        header = "# word,start_ms,end_ms,global_m_start,global_m_end,local_m_start,local_m_end,export_path\n"
-
-        if not os.path.exists(CUT_TEMPLATE_FILE):
-            with open(CUT_TEMPLATE_FILE, "w", encoding="utf-8") as f:
-                f.write(header)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        WHISPER_MODELS.preload(**TRANSCRIBE_MODEL_OPTIONS)
+
+    # -------------------- PROJECT INIT --------------------
+    def _init_project(self):
+        self.project = ProjectStore(PROJECT_FILE)
+
+        if self.project.count() == 0:
+            if os.path.exists(CUT_TEMPLATE_FILE):
+                n = self.project.import_cut_template(CUT_TEMPLATE_FILE)
+                # Move it aside so "start fresh" doesn't bring the entries back
+                os.replace(CUT_TEMPLATE_FILE, CUT_TEMPLATE_FILE + ".imported")
+                if n:
+                    print(f"[PROJECT] Imported {n} entries from {CUT_TEMPLATE_FILE} "
+                          f"(renamed to {CUT_TEMPLATE_FILE}.imported)")
             return
 
-        has_content = False
-        try:
-            with open(CUT_TEMPLATE_FILE, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        has_content = True
-                        break
-        except Exception:
-            has_content = False
-
-        if has_content:
-            ans = messagebox.askyesno(
-                "cutTemplate.txt",
-                "cutTemplate.txt already contains entries.\n\n"
-                "Do you want to clean it (start fresh)?"
-            )
-            if ans:
-                with open(CUT_TEMPLATE_FILE, "w", encoding="utf-8") as f:
-                    f.write(header)
+        ans = messagebox.askyesno(
+            PROJECT_FILE,
+            f"{PROJECT_FILE} already contains entries.\n\n"
+            "Do you want to clean it (start fresh)?"
+        )
+        if ans:
+            self.project.clear()
         else:
-            with open(CUT_TEMPLATE_FILE, "w", encoding="utf-8") as f:
-                f.write(header)
+            self._load_global_margins()
+
+    def _load_global_margins(self):
+        """Read the project globals; legacy projects fall back to the rows' average."""
+        g_start = self.project.get_meta("global_start_ms")
+        g_end = self.project.get_meta("global_end_ms")
+        if g_start is None or g_end is None:
+            words = self.words or self.project.load_words()
+            if len(words):
+                g_start = round(words.column("g_start").mean() * 1000.0)
+                g_end = round(words.column("g_end").mean() * 1000.0)
+            else:
+                g_start = g_end = 0
+        self.global_start_ms = int(g_start)
+        self.global_end_ms = int(g_end)
 
     # -------------------- UI SETUP --------------------
     def setup_ui(self):
@@ -177,6 +2096,7 @@ class BootlegTextSlicer(ctk.CTk):
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.canvas_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill="both", expand=True)
+        self.timeline = TimelineRenderer(self.fig, self.ax, self.canvas)
 
         # Sliders for transcription range
         trim_frame = ctk.CTkFrame(left, fg_color="transparent")
@@ -232,7 +2152,7 @@ class BootlegTextSlicer(ctk.CTk):
 
         self.btn_load_template = ctk.CTkButton(
             btn_row,
-            text="Load cutTemplate + Audio",
+            text="Load Project + Audio",
             fg_color="#222",
             hover_color=HOVER_NEUTRAL,
             width=210,
@@ -286,6 +2206,26 @@ class BootlegTextSlicer(ctk.CTk):
         )
         self.btn_transcribe.pack(side="left", padx=4, pady=4)
 
+        self.var_parallel = ctk.BooleanVar(value=True)
+        self.chk_parallel = ctk.CTkCheckBox(
+            btn_row,
+            text=f"Parallel ({TRANSCRIBE_WORKERS} workers)",
+            variable=self.var_parallel,
+            fg_color=COLOR_SUCCESS,
+            hover_color=HOVER_SUCCESS
+        )
+        self.chk_parallel.pack(side="left", padx=8, pady=4)
+
+        self.var_vad = ctk.BooleanVar(value=VAD_FILTER)
+        self.chk_vad = ctk.CTkCheckBox(
+            btn_row,
+            text="Skip silence (VAD)",
+            variable=self.var_vad,
+            fg_color=COLOR_SUCCESS,
+            hover_color=HOVER_SUCCESS
+        )
+        self.chk_vad.pack(side="left", padx=8, pady=4)
+
         # RIGHT side: words panel
         right = ctk.CTkFrame(main, fg_color="#0a0a0a", border_width=1, border_color="#1a1a1a")
         right.pack(side="left", fill="y", padx=(0, 0), pady=5)
@@ -332,12 +2272,17 @@ class BootlegTextSlicer(ctk.CTk):
         )
         word_wave_frame.pack(fill="both", expand=False, padx=10, pady=10)
 
-        self.fig_word, self.ax_word = plt.subplots(figsize=(4, 2))
-        self.fig_word.patch.set_facecolor(BG_BLACK)
-        self.ax_word.set_facecolor(BG_BLACK)
-        self.fig_word.subplots_adjust(left=0.02, right=0.98, top=0.9, bottom=0.2)
-        self.canvas_word = FigureCanvasTkAgg(self.fig_word, master=word_wave_frame)
-        self.canvas_word.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas_word = tk.Canvas(
+            word_wave_frame,
+            bg=BG_BLACK,
+            height=THUMB_HEIGHT,
+            highlightthickness=0
+        )
+        self.canvas_word.pack(fill="both", expand=True, padx=2, pady=2)
+        self.thumb_item = self.canvas_word.create_polygon(
+            0, 0, 0, 0, 0, 0, fill=ACCENT_BLUE, outline=ACCENT_BLUE, state="hidden"
+        )
+        self.canvas_word.bind("<Configure>", lambda e: self._draw_word_thumbnail())
 
         # Export name
         rename_frame = ctk.CTkFrame(right, fg_color="transparent")
@@ -351,6 +2296,14 @@ class BootlegTextSlicer(ctk.CTk):
         ).pack(side="left", padx=5)
         self.entry_export_name = ctk.CTkEntry(rename_frame, width=180, height=32, font=("Arial", 14))
         self.entry_export_name.pack(side="left", padx=5)
+        self.var_export_format = ctk.StringVar(value=EXPORT_FORMATS[0])
+        ctk.CTkOptionMenu(
+            rename_frame,
+            values=list(EXPORT_FORMATS),
+            variable=self.var_export_format,
+            width=70,
+            height=32
+        ).pack(side="left", padx=5)
 
         # Global margins
         global_box = ctk.CTkFrame(right, fg_color="transparent")
@@ -488,6 +2441,16 @@ class BootlegTextSlicer(ctk.CTk):
         )
         self.btn_approve.pack(side="left", padx=2, pady=4)
 
+        self.btn_approve_all = ctk.CTkButton(
+            nav_box,
+            text="Approve All",
+            fg_color="#1f5f2f",
+            hover_color=HOVER_SUCCESS,
+            width=100,
+            command=self.approve_all_remaining
+        )
+        self.btn_approve_all.pack(side="left", padx=2, pady=4)
+
         self.btn_skip = ctk.CTkButton(
             nav_box,
             text="Skip [ESC]",
@@ -515,7 +2478,7 @@ class BootlegTextSlicer(ctk.CTk):
 
     # -------------------- Helpers --------------------
     def audio_length_ms(self):
-        return len(self.audio_seg) if self.audio_seg else 0
+        return self.source.duration_ms if self.source else 0
 
     # -------------------- File I/O --------------------
     def open_file(self):
@@ -528,131 +2491,69 @@ class BootlegTextSlicer(ctk.CTk):
         if not file_path:
             return
         try:
-            self.audio_seg = AudioSegment.from_file(file_path)
-            self.audio_path = file_path
-            self.global_avg_dbfs = (
-                self.audio_seg.dBFS if self.audio_seg.dBFS != float("-inf") else -20.0
-            )
-
-            total_ms = self.audio_length_ms()
-            self.start_slider.configure(from_=0, to=total_ms)
-            self.end_slider.configure(from_=0, to=total_ms)
-            self.start_slider.set(0)
-            self.end_slider.set(total_ms)
-            self.sel_start_ms = 0.0
-            self.sel_end_ms = total_ms
-
-            self.zoom_factor = 1.0
-            self.view_start = 0.0
-            self.playhead_pos = 0.0
-
+            self._load_audio(file_path)
             self._update_status_filename(extra="")
-            y, _ = librosa.load(file_path, sr=self.sr)
-            self.audio_np = y
-
             self.update_range_label()
             self.update_plot()
         except Exception as e:
             messagebox.showerror("Error", f"Error loading file:\n{e}")
 
     def load_from_template(self):
-        if not os.path.exists(CUT_TEMPLATE_FILE):
-            messagebox.showerror("Missing", f"{CUT_TEMPLATE_FILE} not found.")
+        if self.project.count() == 0:
+            messagebox.showinfo("Empty", f"{PROJECT_FILE} has no entries.")
             return
 
-        entries = []
-        with open(CUT_TEMPLATE_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split(",", 7)
-                # word,start_ms,end_ms,global_m_start,global_m_end,local_m_start,local_m_end,export_path
-                if len(parts) < 7:
-                    # legacy format (word,start_ms,end_ms,export_path)
-                    if len(parts) == 4:
-                        name, s_ms, e_ms, pth = parts
-                        try:
-                            s_ms = float(s_ms)
-                            e_ms = float(e_ms)
-                        except:
-                            continue
-                        entries.append((name, s_ms, e_ms, 0.0, 0.0, 0.0, 0.0, pth))
-                    continue
-                name = parts[0]
-                try:
-                    s_ms = float(parts[1])
-                    e_ms = float(parts[2])
-                except:
-                    continue
-                try:
-                    g_start = float(parts[3])
-                    g_end = float(parts[4])
-                    l_start = float(parts[5])
-                    l_end = float(parts[6])
-                except:
-                    g_start = 0.0
-                    g_end = 0.0
-                    l_start = 0.0
-                    l_end = 0.0
-                pth = parts[7] if len(parts) >= 8 else ""
-                entries.append((name, s_ms, e_ms, g_start, g_end, l_start, l_end, pth))
-
-        if not entries:
-            messagebox.showinfo("Empty", "cutTemplate.txt has no entries.")
-            return
-
-        audio_path = filedialog.askopenfilename(
-            title="Select original audio file for this cutTemplate.txt",
-            filetypes=[("Audio", "*.wav *.mp3 *.flac *.m4a *.ogg *.aac"), ("All files", "*.*")]
-        )
+        audio_path = self.project.get_meta("source_path")
+        digest = self.project.get_meta("source_digest")
+        if not (audio_path and os.path.exists(audio_path) and file_digest(audio_path) == digest):
+            audio_path = filedialog.askopenfilename(
+                title=f"Select original audio file for this {PROJECT_FILE}",
+                filetypes=[("Audio", "*.wav *.mp3 *.flac *.m4a *.ogg *.aac"), ("All files", "*.*")]
+            )
         if not audio_path:
             return
 
         try:
-            self.audio_seg = AudioSegment.from_file(audio_path)
-            self.audio_path = audio_path
-            self.global_avg_dbfs = (
-                self.audio_seg.dBFS if self.audio_seg.dBFS != float("-inf") else -20.0
-            )
-
-            total_ms = self.audio_length_ms()
-            self.start_slider.configure(from_=0, to=total_ms)
-            self.end_slider.configure(from_=0, to=total_ms)
-            self.start_slider.set(0)
-            self.end_slider.set(total_ms)
-            self.sel_start_ms = 0.0
-            self.sel_end_ms = total_ms
-
-            self.zoom_factor = 1.0
-            self.view_start = 0.0
-            self.playhead_pos = 0.0
-
-            y, _ = librosa.load(audio_path, sr=self.sr)
-            self.audio_np = y
-
-            self.words = []
-            for (name, s_ms, e_ms, g_start, g_end, l_start, l_end, pth) in entries:
-                self.words.append(
-                    {
-                        "word": name,
-                        "start_ms": s_ms,
-                        "end_ms": e_ms,
-                        "m_start": l_start,
-                        "m_end": l_end,
-                        "g_start": g_start,
-                        "g_end": g_end,
-                        "export_path": pth,
-                    }
-                )
+            self._load_audio(audio_path)
 
+            self.words = self.project.load_words()
+            self._load_global_margins()
+            self._mark_words_changed()
             self.current_index = 0
             self._update_status_filename(extra=f"({len(self.words)} words)")
             self.update_range_label()
             self.update_word_display()
             self.update_plot()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load from template:\n{e}")
+            messagebox.showerror("Error", f"Failed to load project:\n{e}")
+
+    def _load_audio(self, path):
+        """Decode once and derive playback, waveform and Whisper views."""
+        source = load_source_audio(path, whisper_sr=self.sr)
+        self.project.set_source(source)
+        self.player.set_source(source.pcm, source.frame_rate, source.sample_width)
+        self.pcm = source.pcm
+        self.source = source
+        self.audio_path = path
+        self.audio_np = source.whisper
+        self.chunk_grid = ChunkGrid(source.whisper, self.sr)
+        self.transcripts = TranscriptCache(source.cache_dir)
+        self.peaks = source.peaks
+        self.thumbnails.reset(source.peaks)
+        self.lookahead.reset(source)
+        self.global_avg_dbfs = source.dbfs if source.dbfs is not None else -20.0
+
+        total_ms = self.audio_length_ms()
+        self.start_slider.configure(from_=0, to=total_ms)
+        self.end_slider.configure(from_=0, to=total_ms)
+        self.start_slider.set(0)
+        self.end_slider.set(total_ms)
+        self.sel_start_ms = 0.0
+        self.sel_end_ms = total_ms
+
+        self.zoom_factor = 1.0
+        self.view_start = 0.0
+        self.playhead_pos = 0.0
 
     def _update_status_filename(self, extra=""):
         if self.audio_path:
@@ -664,7 +2565,7 @@ class BootlegTextSlicer(ctk.CTk):
 
     # -------------------- Zoom / scroll / playhead --------------------
     def on_mouse_wheel(self, event):
-        if not self.audio_seg:
+        if not self.source:
             return
         if (event.state & 0x4) != 0:  # Ctrl = zoom
             direction = 1 if event.delta > 0 else -1
@@ -675,13 +2576,13 @@ class BootlegTextSlicer(ctk.CTk):
         self.update_plot()
 
     def on_mouse_wheel_mac_up(self, event):
-        if not self.audio_seg:
+        if not self.source:
             return
         self.adjust_zoom(1, event.x)
         self.update_plot()
 
     def on_mouse_wheel_mac_down(self, event):
-        if not self.audio_seg:
+        if not self.source:
             return
         self.adjust_zoom(-1, event.x)
         self.update_plot()
@@ -691,7 +2592,7 @@ class BootlegTextSlicer(ctk.CTk):
         self.zoom_factor *= (1.0 + 0.2 * direction)
         self.zoom_factor = max(0.1, min(5.0, self.zoom_factor))
 
-        if not self.audio_seg:
+        if not self.source:
             return
 
         width = self.canvas_widget.winfo_width() or 1
@@ -705,14 +2606,14 @@ class BootlegTextSlicer(ctk.CTk):
         self.view_start = max(0.0, min(1.0 - new_view_width, self.view_start))
 
     def adjust_scroll(self, amount):
-        if not self.audio_seg:
+        if not self.source:
             return
         view_width = 1.0 / self.zoom_factor
         self.view_start += amount * view_width
         self.view_start = max(0.0, min(1.0 - view_width, self.view_start))
 
     def _event_x_to_playhead_norm(self, event_x):
-        if not self.audio_seg:
+        if not self.source:
             return 0.0
         inv = self.ax.transAxes.inverted()
         x_axes, _ = inv.transform((event_x, 0))
@@ -721,173 +2622,98 @@ class BootlegTextSlicer(ctk.CTk):
         return self.view_start + x_axes * view_width
 
     def on_canvas_click(self, event):
-        if not self.audio_seg:
+        if not self.source:
             return
         if self.is_playing:
             return
         self.playhead_pos = self._event_x_to_playhead_norm(event.x)
         self.playhead_pos = max(0.0, min(1.0, self.playhead_pos))
         self.dragging_playhead = True
-        self.update_plot()
+        self._refresh_overlay()
 
     def on_canvas_drag(self, event):
-        if not self.audio_seg or not self.dragging_playhead:
+        if not self.source or not self.dragging_playhead:
             return
         if self.is_playing:
             return
         self.playhead_pos = self._event_x_to_playhead_norm(event.x)
         self.playhead_pos = max(0.0, min(1.0, self.playhead_pos))
-        self.update_plot()
+        self._refresh_overlay()
 
     def on_canvas_release(self, _event):
         self.dragging_playhead = False
 
     # -------------------- Plot --------------------
-    def update_plot(self):
-        if not self.audio_seg:
-            self.ax.clear()
-            self.ax.axis("off")
-            self.canvas.draw()
-            return
-
-        self.ax.clear()
-
-        samples = np.array(self.audio_seg.get_array_of_samples(), dtype=np.float32)
-        total_len = len(samples)
-        if total_len == 0:
-            self.canvas.draw()
-            return
-
+    def _view_norm(self):
         view_width = 1.0 / self.zoom_factor
-        start_norm = self.view_start
-        end_norm = self.view_start + view_width
-        start_norm = max(0.0, start_norm)
-        end_norm = min(1.0, end_norm)
-
-        start_idx = int(start_norm * total_len)
-        end_idx = int(end_norm * total_len)
-        end_idx = max(start_idx + 1, end_idx)
-
-        view_samples = samples[start_idx:end_idx]
-        step = max(1, len(view_samples) // 6000)
-        view_samples_ds = view_samples[::step]
-
-        x_data = np.arange(len(view_samples_ds))
-        self.ax.plot(
-            x_data,
-            view_samples_ds,
-            color=TIMELINE_AUDIO,
-            linewidth=WAVEFORM_STROKE,
-            alpha=0.9
-        )
-
-        total_ms = self.audio_length_ms()
-
-        def ms_to_x(ms_val):
-            if total_ms <= 0:
-                return 0.0
-            sample_global = (ms_val / total_ms) * total_len
-            norm_global = sample_global / total_len
-            if end_norm == start_norm:
-                rel = 0.0
-            else:
-                rel = (norm_global - start_norm) / (end_norm - start_norm)
-            rel = max(0.0, min(1.0, rel))
-            return rel * (len(view_samples_ds) - 1)
-
-        # Selected range markers
-        s_val = self.sel_start_ms
-        e_val = self.sel_end_ms
-        s_val = max(0.0, min(total_ms, s_val))
-        e_val = max(s_val, min(total_ms, e_val))
-
-        s_x = ms_to_x(s_val)
-        e_x = ms_to_x(e_val)
-
-        self.ax.axvline(s_x, color=COLOR_SUCCESS, lw=1.5)   # green start
-        self.ax.axvline(e_x, color=ACCENT_PURPLE, lw=1.5)   # purple end
-
-        # Highlight selection
-        self.ax.axvspan(s_x, e_x, color="#333333", alpha=0.25)
-
-        # Word markers
-        for i, w in enumerate(self.words):
-            s_eff, e_eff = self.get_effective_ms(w)
-            sx = ms_to_x(s_eff)
-            ex = ms_to_x(e_eff)
-            if ex < 0 or sx > len(view_samples_ds) - 1:
-                continue
-            color = COLOR_MARGINAL if i == self.current_index else "#444444"
-            self.ax.axvline(sx, color=color, lw=0.8, alpha=0.7)
-            self.ax.axvline(ex, color=color, lw=0.8, alpha=0.7)
-
-        # Playhead
-        ph_norm = self.playhead_pos
-        if end_norm > start_norm:
-            rel_view = (ph_norm - start_norm) / (end_norm - start_norm)
-        else:
-            rel_view = 0.0
-        rel_view = max(0.0, min(1.0, rel_view))
-        ph_x = rel_view * (len(view_samples_ds) - 1)
-        self.ax.axvline(ph_x, color=TIMELINE_CLICK, lw=1.5)
-
-        self.draw_time_ruler(start_norm, end_norm)
-
-        self.ax.axis("off")
-        self.canvas.draw()
+        return max(0.0, self.view_start), min(1.0, self.view_start + view_width)
 
-    def draw_time_ruler(self, start_norm, end_norm):
-        total_ms = self.audio_length_ms()
-        if total_ms <= 0:
+    def update_plot(self):
+        """Full redraw: rebuild the cached static layers, then the overlay."""
+        if not self.source or not self.peaks or self.peaks.length == 0:
+            self.timeline.clear()
             return
 
-        total_sec = total_ms / 1000.0
-        start_sec = start_norm * total_sec
-        end_sec = end_norm * total_sec
-        span_sec = max(end_sec - start_sec, 1e-6)
-
-        rough_step = span_sec / 8.0
-        if rough_step <= 0:
+        start_norm, end_norm = self._view_norm()
+        n_bins = max(TIMELINE_MIN_BINS, self.canvas_widget.winfo_width())
+        total_ms = self.audio_length_ms()
+        with TRACE.span("redraw", bins=n_bins, zoom=self.zoom_factor) as span:
+            visible = self._words_in_range(start_norm * total_ms, end_norm * total_ms)
+            span.set(words=len(visible))
+            g_start, g_end = self._compute_current_global_margins()
+            self.timeline.draw_static(
+                self.peaks,
+                start_norm,
+                end_norm,
+                n_bins,
+                total_ms,
+                self.words.effective_starts(g_start, visible),
+                self.words.effective_ends(g_end, visible),
+            )
+            self._refresh_overlay(full=True)
+
+    def _mark_words_changed(self):
+        self._word_index_dirty = True
+        self.lookahead.invalidate()
+
+    def _words_in_range(self, start_ms, end_ms):
+        """Indices of words whose effective interval intersects the range.
+
+        The index holds base + local intervals only, so a global margin change
+        shifts the query window instead of forcing a rebuild.
+        """
+        if self._word_index_dirty:
+            self.word_index.rebuild(self.words.local_starts(), self.words.local_ends())
+            self._word_index_dirty = False
+        # Effective times are clamped at 0, so a window touching 0 must keep
+        # words pushed below it by negative margins.
+        lo = start_ms - self.global_end_ms if start_ms > 0 else float("-inf")
+        return self.word_index.overlapping(lo, end_ms - self.global_start_ms)
+
+    def _reindex_word(self, i):
+        if not self._word_index_dirty:
+            self.word_index.update(i, *local_ms(self.words[i]))
+
+    def _refresh_overlay(self, full=False):
+        """Update playhead, selection and current-word markers; blit unless `full`."""
+        if not self.source:
             return
-        mag = 10 ** int(np.floor(np.log10(rough_step)))
-        norm = rough_step / mag
-        if norm < 1.5:
-            step = 1 * mag
-        elif norm < 3:
-            step = 2 * mag
-        elif norm < 7:
-            step = 5 * mag
+        current = None
+        if self.words and 0 <= self.current_index < len(self.words):
+            current = self.get_effective_ms(self.words[self.current_index])
+        self.timeline.set_overlay(
+            self.playhead_pos,
+            (self.sel_start_ms, self.sel_end_ms),
+            current,
+        )
+        if full:
+            self.timeline.draw()
         else:
-            step = 10 * mag
-
-        sec = np.floor(start_sec / step) * step
-        while sec <= end_sec + 1e-6:
-            t_norm = sec / total_sec
-            if end_norm > start_norm:
-                rel_view = (t_norm - start_norm) / (end_norm - start_norm)
-            else:
-                rel_view = 0.0
-            rel_view = max(0.0, min(1.0, rel_view))
-
-            x_frac = rel_view
-            pct = t_norm * 100.0
-            label = f"{sec:0.1f}s | {pct:0.0f}%"
-
-            self.ax.text(
-                x_frac,
-                -0.15,
-                label,
-                transform=self.ax.transAxes,
-                ha="center",
-                va="top",
-                fontsize=8,
-                color="#AAAAAA"
-            )
-            sec += step
+            self.timeline.blit()
 
     # -------------------- Slider / range --------------------
     def on_slider_change(self, _=None):
-        if not self.audio_seg:
+        if not self.source:
             return
         total_ms = self.audio_length_ms()
         s_val = float(self.start_slider.get() or 0.0)
@@ -897,7 +2723,7 @@ class BootlegTextSlicer(ctk.CTk):
         self.sel_start_ms = s_val
         self.sel_end_ms = e_val
         self.update_range_label()
-        self.update_plot()
+        self._refresh_overlay()
 
     def update_range_label(self):
         dur = max(0.0, (self.sel_end_ms - self.sel_start_ms) / 1000.0)
@@ -910,92 +2736,98 @@ class BootlegTextSlicer(ctk.CTk):
     # -------------------- Playback helpers --------------------
     def stop_playback(self):
         self.is_playing = False
-        pygame.mixer.music.stop()
-        try:
-            pygame.mixer.music.unload()
-        except Exception:
-            pass
+        self.player.stop()
         if self._playhead_updater_id is not None:
             self.after_cancel(self._playhead_updater_id)
             self._playhead_updater_id = None
 
-    def _segment_ms(self, start_ms, end_ms):
-        if not self.audio_seg:
-            return None
-        total_ms = self.audio_length_ms()
-        start_ms = max(0.0, min(total_ms, start_ms))
-        end_ms = max(start_ms, min(total_ms, end_ms))
-        return self.audio_seg[int(start_ms):int(end_ms)]
+    def _play_ms(self, start_ms, end_ms):
+        """Start playback of [start_ms, end_ms) straight from the PCM buffer."""
+        if not self.source or end_ms <= start_ms:
+            return False
+        rate = self.source.frame_rate
+        self.player.play(start_ms * rate / 1000.0, end_ms * rate / 1000.0)
+        self._trace_playback_start()
+        return True
+
+    def _trace_playback_start(self):
+        if TRACE.enabled:
+            self.after(PLAYBACK_TRACE_MS, self._emit_playback_start)
+
+    def _emit_playback_start(self):
+        latency = self.player.take_start_latency()
+        if latency is not None:
+            TRACE.metric("playback_start_ms", round(latency[0], 3), prepared=latency[1])
+
+    def _start_playhead_tracking(self):
+        self.is_playing = True
+        if self._playhead_updater_id is not None:
+            self.after_cancel(self._playhead_updater_id)
+        self._playhead_updater_id = self.after(PLAYHEAD_FRAME_MS, self._update_playhead)
+
+    def _update_playhead(self):
+        """Follow the device clock at ~60 fps, repainting only the playhead."""
+        self._playhead_updater_id = None
+        total_frames = self.player.total_frames
+        if not self.is_playing or total_frames == 0:
+            return
+        self.playhead_pos = self.player.position() / total_frames
+
+        view_width = 1.0 / self.zoom_factor
+        if self.playhead_pos > self.view_start + view_width:
+            # Page the view forward once the playhead leaves it
+            self.view_start = max(0.0, min(1.0 - view_width, self.playhead_pos - 0.1 * view_width))
+            self.update_plot()
+        else:
+            self._refresh_overlay()
+
+        if self.player.active:
+            self._playhead_updater_id = self.after(PLAYHEAD_FRAME_MS, self._update_playhead)
+        else:
+            self.is_playing = False
 
     def play_from_playhead(self):
-        if not self.audio_seg:
+        if not self.source:
             return
         self.stop_playback()
         total_ms = self.audio_length_ms()
-        ph_ms = self.playhead_pos * total_ms
-        seg = self._segment_ms(ph_ms, total_ms)
-        if not seg or len(seg) == 0:
-            return
-        buf = io.BytesIO()
-        seg.export(buf, format="wav")
-        buf.seek(0)
-        pygame.mixer.music.load(buf)
-        pygame.mixer.music.play()
-        self.is_playing = True
+        if self._play_ms(self.playhead_pos * total_ms, total_ms):
+            self._start_playhead_tracking()
 
     def play_selection(self):
-        if not self.audio_seg:
+        if not self.source:
             return
         self.stop_playback()
-        seg = self._segment_ms(self.sel_start_ms, self.sel_end_ms)
-        if not seg or len(seg) == 0:
+        if not self._play_ms(self.sel_start_ms, self.sel_end_ms):
             return
-        buf = io.BytesIO()
-        seg.export(buf, format="wav")
-        buf.seek(0)
-        pygame.mixer.music.load(buf)
-        pygame.mixer.music.play()
-        self.is_playing = True
         if self.audio_length_ms() > 0:
             self.playhead_pos = self.sel_start_ms / self.audio_length_ms()
-            self.update_plot()
+            self._refresh_overlay()
+        self._start_playhead_tracking()
+
+    def _play_word(self, i):
+        """Play word i, from its lookahead buffer when one is ready."""
+        frames = self._word_frames(i)
+        if frames[1] <= frames[0]:
+            return
+        entry = self.lookahead.get(i, frames)
+        self.player.play(*frames, entry.buffer if entry else None)
+        self._trace_playback_start()
 
     def play_current_word(self):
         """Immediate manual playback (Down arrow, Play button)."""
-        if not self.audio_seg or not self.words:
+        if not self.source or not self.words:
             return
-        w = self.words[self.current_index]
-        s_eff, e_eff = self.get_effective_ms(w)
-        seg = self._segment_ms(s_eff, e_eff)
-        if not seg or len(seg) == 0:
-            return
-        buf = io.BytesIO()
-        seg.export(buf, format="wav")
-        buf.seek(0)
-        with self._play_lock:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(buf)
-            pygame.mixer.music.play()
+        self._play_word(self.current_index)
 
     def play_current_word_auto(self):
         """Auto-play used for word activation or margin changes."""
-        if not self.audio_seg or not self.words:
+        if not self.source or not self.words:
             return
-        w = self.words[self.current_index]
-        s_eff, e_eff = self.get_effective_ms(w)
-        seg = self._segment_ms(s_eff, e_eff)
-        if not seg or len(seg) == 0:
-            return
-        buf = io.BytesIO()
-        seg.export(buf, format="wav")
-        buf.seek(0)
-        with self._play_lock:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(buf)
-            pygame.mixer.music.play()
-
-    def schedule_margin_play(self, delay_ms=150):
-        """Schedule a single playback after margins change."""
+        self._play_word(self.current_index)
+
+    def schedule_margin_play(self, delay_ms=MARGIN_IDLE_MS):
+        """(Re)start the idle window after which pending margins are rendered and played."""
         if self._margin_play_after_id is not None:
             self.after_cancel(self._margin_play_after_id)
             self._margin_play_after_id = None
@@ -1003,10 +2835,12 @@ class BootlegTextSlicer(ctk.CTk):
 
     def _margin_play_callback(self):
         self._margin_play_after_id = None
+        if self._flush_margin_edits():
+            self.update_word_display()
 
     # -------------------- Transcription --------------------
     def transcribe_selected_async(self):
-        if self.audio_np is None or self.audio_seg is None:
+        if self.audio_np is None or self.source is None:
             messagebox.showerror("Error", "Load an audio file first.")
             return
         if self.sel_end_ms <= self.sel_start_ms:
@@ -1016,14 +2850,28 @@ class BootlegTextSlicer(ctk.CTk):
             return
 
         self.btn_transcribe.configure(state="disabled")
-        self.transcribe_label.configure(text="Transcribing...", text_color=COLOR_MARGINAL)
+        self._set_transcribe_progress(0.0, 0)
+
+        # Words arrive incrementally, so start from an empty table
+        self.project.clear_range(self.sel_start_ms, self.sel_end_ms)
+        self.words = WordTable()
+        self._mark_words_changed()
+        self.current_index = 0
+        self.update_word_display()
+        self.update_plot()
+
+        self._transcribe_queue = queue.Queue()
         self._transcribe_thread = threading.Thread(
             target=self._transcribe_selected,
+            args=(self._transcribe_queue, self.var_parallel.get(), self.var_vad.get()),
             daemon=True
         )
         self._transcribe_thread.start()
+        self._transcribe_poll_id = self.after(TRANSCRIBE_POLL_MS, self._poll_transcribe_queue)
 
-    def _transcribe_selected(self):
+    def _transcribe_selected(self, out_queue, parallel=False, vad=False):
+        """Worker thread: pushes ("words", list), ("progress", frac) and a final
+        ("done", count) or ("error", message) onto out_queue."""
         start_time = time.time()
         try:
             total_ms = self.audio_length_ms()
@@ -1031,72 +2879,115 @@ class BootlegTextSlicer(ctk.CTk):
             if total_s <= 0:
                 raise RuntimeError("Audio length is zero.")
 
+            sel_start_ms = self.sel_start_ms
+            sel_end_ms = self.sel_end_ms
             full_len = len(self.audio_np)
-            s_sec = self.sel_start_ms / 1000.0
-            e_sec = self.sel_end_ms / 1000.0
+            s_sec = sel_start_ms / 1000.0
+            e_sec = sel_end_ms / 1000.0
             s_idx = int((s_sec / total_s) * full_len)
             e_idx = int((e_sec / total_s) * full_len)
             s_idx = max(0, min(full_len - 1, s_idx))
             e_idx = max(s_idx + 1, min(full_len, e_idx))
 
-            segment_np = self.audio_np[s_idx:e_idx]
-            sel_duration_s = (self.sel_end_ms - self.sel_start_ms) / 1000.0
-
-            tmp_path = "_tmp_bt_range.wav"
-            sf.write(tmp_path, segment_np, self.sr)
-
-            model = WhisperModel("small", device="cpu", compute_type="int8")
-            segments, _ = model.transcribe(tmp_path, word_timestamps=True)
-
-            os.remove(tmp_path)
-
-            new_words = []
-            for seg in segments:
-                for w in seg.words:
-                    if not w.word.strip():
-                        continue
-                    start_ms = self.sel_start_ms + float(w.start) * 1000.0
-                    end_ms = self.sel_start_ms + float(w.end) * 1000.0
-                    new_words.append(
-                        {
-                            "word": w.word.strip(),
-                            "start_ms": start_ms,
-                            "end_ms": end_ms,
-                            "m_start": 0.0,
-                            "m_end": 0.0,
-                            "g_start": 0.0,
-                            "g_end": 0.0,
-                            "export_path": "",
-                        }
-                    )
-
-            self.words = new_words
-            self.current_index = 0
+            sel_duration_s = (sel_end_ms - sel_start_ms) / 1000.0
+
+            # audio_np is already 16 kHz mono float32, which faster-whisper
+            # accepts directly; cached chunks of it skip the model entirely.
+            workers = 1
+            if parallel and sel_duration_s >= PARALLEL_MIN_SECONDS:
+                workers = TRANSCRIBE_WORKERS
+            words_iter = transcribe_range(
+                self.audio_np, self.sr, s_idx, e_idx, self.chunk_grid, self.transcripts, vad, workers
+            )
+
+            num_words = 0
+            batch = []
+            last_flush = time.time()
+            for w in words_iter:
+                batch.append(w)
+                now = time.time()
+                if now - last_flush >= TRANSCRIBE_POLL_MS / 1000.0:
+                    num_words += len(batch)
+                    out_queue.put(("words", batch))
+                    out_queue.put(("progress", (w["end_ms"] - sel_start_ms) / 1000.0 / sel_duration_s))
+                    batch = []
+                    last_flush = now
+            if batch:
+                num_words += len(batch)
+                out_queue.put(("words", batch))
 
             elapsed = time.time() - start_time
-            num_words = len(self.words)
             rtf = sel_duration_s / elapsed if elapsed > 0 else 0.0
 
             print("\n" + "=" * 60)
             print("BOOTLEG TEXT SLICER - TRANSCRIPTION COMPLETE")
             if self.audio_path:
                 print(f"File: {os.path.basename(self.audio_path)}")
-            print(f"Selected Range: {self.sel_start_ms/1000.0:0.3f}s -> {self.sel_end_ms/1000.0:0.3f}s "
+            print(f"Selected Range: {sel_start_ms/1000.0:0.3f}s -> {sel_end_ms/1000.0:0.3f}s "
                   f"({sel_duration_s:0.3f}s)")
             print(f"Words Detected: {num_words}")
             print(f"Processing Time: {elapsed:0.2f}s")
             print(f"Efficiency: {rtf:0.2f}x Realtime")
             print("=" * 60 + "\n")
+            TRACE.metric("transcribe_rtf", round(rtf, 3), words=num_words, seconds=sel_duration_s)
 
-            self.after(0, lambda: self._after_transcribe_success(num_words))
+            out_queue.put(("done", num_words))
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Error", f"Transcription failed:\n{e}"))
-            self.after(0, self._after_transcribe_done)
+            out_queue.put(("error", str(e)))
+
+    def _poll_transcribe_queue(self):
+        self._transcribe_poll_id = None
+        new_words = False
+        while True:
+            try:
+                kind, payload = self._transcribe_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "words":
+                first = not self.words
+                self.project.add_words(payload)
+                self.words.extend(payload)
+                self._mark_words_changed()
+                new_words = True
+                if first:
+                    self.update_word_display()
+            elif kind == "progress":
+                self._set_transcribe_progress(payload, len(self.words))
+            elif kind == "done":
+                self._after_transcribe_success(payload)
+                return
+            elif kind == "error":
+                messagebox.showerror("Error", f"Transcription failed:\n{payload}")
+                self._after_transcribe_done()
+                self.update_plot()
+                return
+
+        if new_words:
+            self.lbl_word_index.configure(
+                text=f"Word {self.current_index+1} / {len(self.words)}"
+            )
+            self._update_status_filename(extra=f"({len(self.words)} words, transcribing)")
+            now = time.time()
+            if now - self._last_stream_replot >= TRANSCRIBE_REPLOT_MS / 1000.0:
+                self._last_stream_replot = now
+                self.update_plot()
+        self._transcribe_poll_id = self.after(TRANSCRIBE_POLL_MS, self._poll_transcribe_queue)
+
+    def _set_transcribe_progress(self, frac, num_words):
+        frac = max(0.0, min(1.0, frac))
+        filled = int(round(frac * PROGRESS_BAR_CELLS))
+        bar = "█" * filled + "░" * (PROGRESS_BAR_CELLS - filled)
+        self.transcribe_label.configure(
+            text=f"Transcribing  {bar}  {frac*100:3.0f}%  ({num_words} words)",
+            text_color=COLOR_MARGINAL
+        )
 
     def _after_transcribe_success(self, num_words):
         self._after_transcribe_done()
         self._update_status_filename(extra=f"({num_words} words)")
-        self.update_word_display()
+        self.lbl_word_index.configure(
+            text=f"Word {self.current_index+1} / {len(self.words)}" if self.words else ""
+        )
         self.update_plot()
         messagebox.showinfo("Done", f"Transcription complete.\nWords detected: {num_words}")
 
@@ -1106,26 +2997,12 @@ class BootlegTextSlicer(ctk.CTk):
 
     # -------------------- Word / margins --------------------
     def get_effective_ms(self, w):
-        # effective = base times + global + local
-        g_start = w.get("g_start", 0.0)
-        g_end = w.get("g_end", 0.0)
-        s = w["start_ms"] + (g_start + w.get("m_start", 0.0)) * 1000.0
-        e = w["end_ms"] + (g_end + w.get("m_end", 0.0)) * 1000.0
-        return max(0.0, s), max(0.0, e)
+        return effective_ms(w, *self._compute_current_global_margins())
 
     def _compute_current_global_margins(self):
-        if not self.words:
-            return 0.0, 0.0
-        avg_start = sum(w.get("g_start", 0.0) for w in self.words) / len(self.words)
-        avg_end = sum(w.get("g_end", 0.0) for w in self.words) / len(self.words)
-        return avg_start, avg_end
+        return self.global_start_ms / 1000.0, self.global_end_ms / 1000.0
 
     def _recompute_global_offsets_label(self):
-        if not self.words:
-            self.lbl_global_offsets.configure(
-                text="Global: start +0.000s, end +0.000s"
-            )
-            return
         g_start, g_end = self._compute_current_global_margins()
         self.lbl_global_offsets.configure(
             text=f"Global: start {g_start:+0.3f}s, end {g_end:+0.3f}s"
@@ -1144,36 +3021,58 @@ class BootlegTextSlicer(ctk.CTk):
         )
 
     def adj_global(self, key, val):
-        # key is "m_start" or "m_end" but we treat it as global in g_start/g_end
+        # key is "m_start" or "m_end"; one project-level value, no per-word writes
+        delta = round(val * 1000.0)
         if key == "m_start":
-            for w in self.words:
-                w["g_start"] = round(w.get("g_start", 0.0) + val, 4)
+            self.global_start_ms += delta
         else:
-            for w in self.words:
-                w["g_end"] = round(w.get("g_end", 0.0) + val, 4)
+            self.global_end_ms += delta
+        self._global_margins_unsaved = True
+        # Every prepared buffer was cut under the old globals
+        self.lookahead.invalidate()
         self._recompute_global_offsets_label()
-        self.update_word_display()
-        self.update_plot()
-        # Only schedule delayed play (no direct play) to avoid double-play
-        self.schedule_margin_play()
+        self._note_margin_edit()
 
     def adj_individual(self, key, val):
         if not self.words:
             return
         w = self.words[self.current_index]
-        w[key] = round(w.get(key, 0.0) + val, 4)
+        w[key] = nudge_seconds(w.get(key, 0.0), val)
+        self._reindex_word(self.current_index)
+        self.lookahead.invalidate(self.current_index)
         self._update_indiv_offsets_label()
-        self.update_word_display()
-        self.update_plot()
-        # Only schedule delayed play (no direct play) to avoid double-play
+        self._note_margin_edit()
+
+    def _note_margin_edit(self):
+        """Owe one replot + audition, pushed back by every further nudge."""
+        self._margins_dirty = True
         self.schedule_margin_play()
 
+    def _save_global_margins(self):
+        if self._global_margins_unsaved:
+            self.project.set_meta(
+                global_start_ms=self.global_start_ms, global_end_ms=self.global_end_ms
+            )
+            self._global_margins_unsaved = False
+
+    def _flush_margin_edits(self):
+        """Render a pending burst now (also before the active word changes)."""
+        if self._margin_play_after_id is not None:
+            self.after_cancel(self._margin_play_after_id)
+            self._margin_play_after_id = None
+        if not self._margins_dirty:
+            return False
+        self._margins_dirty = False
+        self._save_global_margins()
+        self.update_plot()
+        return True
+
     def prev_word(self):
         if not self.words:
             return
         self.current_index = max(0, self.current_index - 1)
         self.update_word_display()
-        self.update_plot()
+        self._refresh_overlay()
 
     def next_word(self):
         if not self.words:
@@ -1183,7 +3082,7 @@ class BootlegTextSlicer(ctk.CTk):
             return
         self.current_index += 1
         self.update_word_display()
-        self.update_plot()
+        self._refresh_overlay()
 
     def skip_current_word(self):
         if not self.words:
@@ -1193,55 +3092,16 @@ class BootlegTextSlicer(ctk.CTk):
             return
         self.current_index += 1
         self.update_word_display()
-        self.update_plot()
+        self._refresh_overlay()
 
     def approve_current_word(self):
-        if not self.audio_seg or not self.words:
+        if not self.source or not self.words:
             return
-        w = self.words[self.current_index]
-
-        # Make sure g_start/g_end reflect the current global margins
-        g_start, g_end = self._compute_current_global_margins()
-        w["g_start"] = g_start
-        w["g_end"] = g_end
 
-        s_eff, e_eff = self.get_effective_ms(w)
-        seg = self._segment_ms(s_eff, e_eff)
-        if not seg or len(seg) == 0:
+        export_name = self.entry_export_name.get().strip() or self._default_export_name(self.current_index)
+        if not self._queue_export(self.current_index, export_name):
             return
 
-        if not os.path.exists("ApprovedWords"):
-            os.makedirs("ApprovedWords")
-
-        export_name = self.entry_export_name.get().strip()
-        if not export_name:
-            clean = "".join(x for x in w["word"] if x.isalnum())
-            export_name = clean if clean else f"word_{self.current_index+1}"
-
-        filename = f"{export_name}_{int(time.time())}.wav"
-        path = os.path.join("ApprovedWords", filename)
-        seg.export(path, format="wav")
-
-        w["export_path"] = path
-
-        base_s_ms = w["start_ms"]
-        base_e_ms = w["end_ms"]
-        # Persist global + local margins and export path
-        line = (
-            f"{export_name},"
-            f"{base_s_ms:.4f},"
-            f"{base_e_ms:.4f},"
-            f"{w.get('g_start', 0.0):.4f},"
-            f"{w.get('g_end', 0.0):.4f},"
-            f"{w.get('m_start', 0.0):.4f},"
-            f"{w.get('m_end', 0.0):.4f},"
-            f"{path}\n"
-        )
-        with open(CUT_TEMPLATE_FILE, "a", encoding="utf-8") as f:
-            f.write(line)
-
-        print(f"[EXPORT] Saved {path} | Duration: {(e_eff - s_eff)/1000.0:.3f}s")
-
         self.entry_export_name.delete(0, "end")
 
         if self.current_index == len(self.words) - 1:
@@ -1249,60 +3109,136 @@ class BootlegTextSlicer(ctk.CTk):
         else:
             self.current_index += 1
             self.update_word_display()
-            self.update_plot()
+            self._refresh_overlay()
+
+    def approve_all_remaining(self):
+        """Queue every not-yet-exported word from the current one onward."""
+        if not self.source or not self.words or self._bulk_export is not None:
+            return
+        first = self.current_index
+        # String-pool code 0 is the empty string, i.e. not exported yet
+        todo = np.flatnonzero(self.words.column("export_path")[first:] == 0) + first
+        if not len(todo):
+            messagebox.showinfo("Done", "All remaining words are already exported.")
+            return
+        if not messagebox.askyesno(
+            "Approve all",
+            f"Export {len(todo)} remaining words as {self.var_export_format.get().upper()}?"
+        ):
+            return
+        self._bulk_export = (self.words, iter(todo.tolist()), len(todo))
+        self.btn_approve_all.configure(state="disabled")
+        self._bulk_export_step()
+
+    def _bulk_export_step(self):
+        """Feed the pool in steps bounded by its backlog so Tk keeps painting."""
+        table, todo, total = self._bulk_export
+        if table is not self.words:
+            todo = iter(())
+        room = EXPORT_WORKERS * 4 - self.exporter.pending
+        for i in todo:
+            self._queue_export(i, self._default_export_name(i))
+            room -= 1
+            if room <= 0:
+                self.after(EXPORT_POLL_MS, self._bulk_export_step)
+                return
+        self._bulk_export = None
+        self.btn_approve_all.configure(state="normal")
+        if table is self.words:
+            self.current_index = len(self.words) - 1
+            self.update_word_display()
+            self._refresh_overlay()
+        print(f"[EXPORT] Queued {total} words")
+
+    def _default_export_name(self, i):
+        clean = clean_word(self.words[i]["word"])
+        return clean if clean else f"word_{i+1}"
+
+    def _queue_export(self, i, export_name):
+        """Slice word i out of the PCM buffer and hand it to the export pool."""
+        w = self.words[i]
+        # Snapshot the current global margins onto the exported row
+        w["g_start"], w["g_end"] = self._compute_current_global_margins()
+        f0, f1 = self._word_frames(i)
+        rate = self.source.frame_rate
+        if f1 <= f0:
+            return False
+
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        fmt = self.var_export_format.get()
+        path = os.path.join(EXPORT_DIR, f"{export_name}_{int(time.time())}_{i+1}.{fmt}")
+        w["export_path"] = path
+        w["export_name"] = export_name
+        self.exporter.submit((self.words, i), w.to_dict(), path, self.pcm[f0:f1], rate, fmt)
+        if self._export_poll_id is None:
+            self._export_poll_id = self.after(EXPORT_POLL_MS, self._poll_exports)
+        return True
+
+    def _poll_exports(self):
+        """Commit finished clips to the project, one transaction per tick."""
+        self._export_poll_id = None
+        self._commit_exports(self.exporter.drain())
+        if self.exporter.pending:
+            self._export_poll_id = self.after(EXPORT_POLL_MS, self._poll_exports)
+
+    def _commit_exports(self, finished):
+        saved = []
+        for (table, i), word, error in finished:
+            if error is None:
+                saved.append((table, i, word))
+                continue
+            print(f"[EXPORT] Failed {word['export_path']}: {error}")
+            if table[i]["export_path"] == word["export_path"]:
+                table[i]["export_path"] = ""
+        if not saved:
+            return
+        # Persist global + local margins and export paths
+        self.project.upsert_words([word for _, _, word in saved])
+        for table, i, word in saved:
+            table[i]["id"] = word["id"]
+        print(f"[EXPORT] Saved {len(saved)} clip(s), {self.exporter.pending} pending")
+
+    def on_close(self):
+        """Let queued exports finish and reach the project before exiting."""
+        self._save_global_margins()
+        self.exporter.shutdown()
+        self._commit_exports(self.exporter.drain())
+        self.player.close()
+        self.project.close()
+        self.destroy()
 
     def update_word_display(self):
+        # Render any margin burst before the panel (and playback) moves on
+        self._flush_margin_edits()
         if not self.words:
             self.lbl_word.configure(text="No word")
             self.lbl_word_index.configure(text="")
             self.lbl_margins.configure(text="")
             self.lbl_stats.configure(text="")
-            self.ax_word.clear()
-            self.ax_word.axis("off")
-            self.canvas_word.draw()
+            self._draw_word_thumbnail()
             self._update_indiv_offsets_label()
             self._recompute_global_offsets_label()
             self._update_status_filename(extra="")
             return
 
-        w = self.words[self.current_index]
-        s_eff, e_eff = self.get_effective_ms(w)
-        dur = max(0.0, (e_eff - s_eff) / 1000.0)
+        i = self.current_index
+        entry = self.lookahead.get(i, self._word_frames(i)) if self.source else None
+        if entry is not None:
+            labels = entry.labels
+        else:
+            labels = word_labels(self.words[i], i, len(self.words),
+                                 *self._compute_current_global_margins())
 
-        self.lbl_word.configure(text=f"'{w['word']}'")
-        self.lbl_word_index.configure(
-            text=f"Word {self.current_index+1} / {len(self.words)}"
-        )
-        self.lbl_margins.configure(
-            text=f"Offsets -> Global: {w.get('g_start', 0.0):+0.3f}s/{w.get('g_end', 0.0):+0.3f}s | "
-                 f"Local: {w.get('m_start', 0.0):+0.3f}s/{w.get('m_end', 0.0):+0.3f}s"
-        )
-        self.lbl_stats.configure(
-            text=f"Base: {w['start_ms']/1000.0:0.3f}s-{w['end_ms']/1000.0:0.3f}s | "
-                 f"Final duration: {dur:0.3f}s"
-        )
+        self.lbl_word.configure(text=labels["word"])
+        self.lbl_word_index.configure(text=labels["index"])
+        self.lbl_margins.configure(text=labels["margins"])
+        self.lbl_stats.configure(text=labels["stats"])
 
-        clean = "".join(x for x in w["word"] if x.isalnum())
         self.entry_export_name.delete(0, "end")
-        if clean:
-            self.entry_export_name.insert(0, clean)
-
-        self.ax_word.clear()
-        if self.audio_seg:
-            seg = self._segment_ms(s_eff, e_eff)
-            if seg and len(seg) > 0:
-                data = np.array(seg.get_array_of_samples(), dtype=np.float32)
-                if len(data) > 20000:
-                    factor = len(data) // 20000
-                    data = data[::factor]
-                self.ax_word.plot(
-                    data,
-                    color=ACCENT_BLUE,
-                    linewidth=1.0,
-                    alpha=0.9
-                )
-        self.ax_word.axis("off")
-        self.canvas_word.draw()
+        if labels["export_name"]:
+            self.entry_export_name.insert(0, labels["export_name"])
+
+        self._draw_word_thumbnail()
 
         self._update_indiv_offsets_label()
         self._recompute_global_offsets_label()
@@ -1311,8 +3247,568 @@ class BootlegTextSlicer(ctk.CTk):
         # Auto-play tiny snippet once whenever a word becomes active
         self.play_current_word_auto()
 
+    def _word_frames(self, i):
+        """Effective (start, end) source frames of word i, clamped to the file."""
+        s_eff, e_eff = self.get_effective_ms(self.words[i])
+        rate = self.source.frame_rate
+        n = len(self.pcm)
+        return min(n, int(s_eff * rate / 1000.0)), min(n, int(e_eff * rate / 1000.0))
+
+    def _word_thumb_key(self, i):
+        return (i, *self._word_frames(i),
+                max(2, self.canvas_word.winfo_width()), THUMB_HEIGHT)
+
+    def _queue_lookahead(self):
+        """Prepare the words review is about to reach, nearest first."""
+        i, n = self.current_index, len(self.words)
+        label_args = (n, *self._compute_current_global_margins())
+        jobs = []
+        for j in (i, *range(i + 1, min(n, i + 1 + LOOKAHEAD_WORDS)), i - 1):
+            if 0 <= j < n:
+                jobs.append((j, self._word_frames(j), self.words[j].to_dict(),
+                             label_args, self._word_thumb_key(j)))
+        self.lookahead.request(jobs)
+
+    def _draw_word_thumbnail(self):
+        """Show the current word's envelope and queue the lookahead."""
+        if not self.source or not self.words:
+            self.canvas_word.itemconfigure(self.thumb_item, state="hidden")
+            return
+        i = self.current_index
+        coords = self.thumbnails.render(self._word_thumb_key(i))
+        if len(coords) >= 6:
+            self.canvas_word.coords(self.thumb_item, *coords)
+            self.canvas_word.itemconfigure(self.thumb_item, state="normal")
+        else:
+            self.canvas_word.itemconfigure(self.thumb_item, state="hidden")
+        self._queue_lookahead()
+
+
+# -------------------- Headless batch --------------------
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".aac", ".m4a")
+BATCH_PROGRESS_FILE = "batch_progress.jsonl"
+
+
+def collect_audio_files(inputs, exclude_dir=None):
+    """Expand directories (recursively), globs and plain paths to audio files."""
+    found = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs[:] = [
+                    d for d in dirs
+                    if d != AUDIO_CACHE_DIR
+                    and os.path.abspath(os.path.join(root, d)) != exclude_dir
+                ]
+                for name in sorted(files):
+                    if name.lower().endswith(AUDIO_EXTENSIONS):
+                        found.append(os.path.join(root, name))
+        elif os.path.isfile(item):
+            found.append(item)
+        else:
+            found.extend(
+                p for p in sorted(glob.glob(item, recursive=True))
+                if p.lower().endswith(AUDIO_EXTENSIONS)
+            )
+    seen = set()
+    return [p for p in map(os.path.abspath, found) if not (p in seen or seen.add(p))]
+
+
+def load_vocabulary(path):
+    if not path:
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return {clean_word(line).lower() for line in f if clean_word(line)}
+
+
+def auto_approve(w, min_duration_ms=0.0, min_probability=0.0, vocabulary=None):
+    """Rule-based stand-in for pressing Approve on a word."""
+    s_eff, e_eff = effective_ms(w)
+    if e_eff - s_eff < min_duration_ms:
+        return False
+    if w.get("probability", 1.0) < min_probability:
+        return False
+    if vocabulary is not None and clean_word(w["word"]).lower() not in vocabulary:
+        return False
+    return bool(clean_word(w["word"]))
+
+
+def _source_key(path):
+    st = os.stat(path)
+    return f"{path}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def batch_slice_file(path, out_dir, opts):
+    """Transcribe one source, export approved words and write its project file."""
+    try:
+        with TRACE.span("batch_file", file=os.path.basename(path)):
+            return _batch_slice_file(path, out_dir, opts)
+    finally:
+        # Hand each file's spans to disk; a worker may be killed before exiting
+        TRACE.flush()
+
+
+def _batch_slice_file(path, out_dir, opts):
+    t0 = time.time()
+    source = load_source_audio(path)
+    model = WHISPER_MODELS.get(
+        opts["model"], opts["compute_type"], WHISPER_DEVICE, cpu_threads=opts["cpu_threads"]
+    )
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    dest = os.path.join(out_dir, stem)
+    os.makedirs(dest, exist_ok=True)
+    rate = source.frame_rate
+    total_ms = source.duration_ms
+    fmt = opts["format"]
+
+    words = []
+    exported = 0
+    for w in transcribe_words(model, source.whisper, 16000, vad=opts["vad"]):
+        words.append(w)
+        w["g_start"] = opts["global_start"]
+        w["g_end"] = opts["global_end"]
+        if not auto_approve(w, opts["min_duration_ms"], opts["min_probability"], opts["vocabulary"]):
+            continue
+        s_eff, e_eff = effective_ms(w)
+        f0 = min(len(source.pcm), int(s_eff * rate / 1000.0))
+        f1 = min(len(source.pcm), int(e_eff * rate / 1000.0))
+        if f1 <= f0:
+            continue
+        export_name = clean_word(w["word"])
+        out_path = os.path.join(dest, f"{export_name}_{len(words):05d}.{fmt}")
+        write_clip(out_path, source.pcm[f0:f1], rate, fmt)
+        w["export_name"] = export_name
+        w["export_path"] = out_path
+        exported += 1
+
+    project = ProjectStore(os.path.join(dest, PROJECT_FILE))
+    project.clear()
+    project.set_source(source)
+    project.add_words(words)
+    project.close()
+    # A raw native-rate copy per chapter adds up over a large batch; keep
+    # only caches that existed before (e.g. from the editor)
+    if not source.cached and not opts["keep_cache"]:
+        source.discard()
+
+    duration_s = total_ms / 1000.0
+    elapsed = time.time() - t0
+    return {
+        "source": path,
+        "key": _source_key(path),
+        "digest": source.digest,
+        "words": len(words),
+        "exported": exported,
+        "duration_s": round(duration_s, 3),
+        "seconds": round(elapsed, 3),
+    }
+
+
+def run_batch(args):
+    files = collect_audio_files(args.inputs, exclude_dir=os.path.abspath(args.out))
+    os.makedirs(args.out, exist_ok=True)
+    progress_path = os.path.join(args.out, BATCH_PROGRESS_FILE)
+
+    done = set()
+    if os.path.exists(progress_path) and not args.restart:
+        with open(progress_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    done.add(json.loads(line)["key"])
+                except (ValueError, KeyError):
+                    continue
+    pending = [p for p in files if _source_key(p) not in done]
+    print(f"[BATCH] {len(files)} files, {len(files) - len(pending)} already done, {len(pending)} to go")
+    if not pending:
+        return 0
+
+    jobs = max(1, args.jobs)
+    opts = {
+        "model": args.model,
+        "compute_type": args.compute_type,
+        "cpu_threads": max(1, (os.cpu_count() or jobs) // jobs),
+        "min_duration_ms": args.min_duration * 1000.0,
+        "min_probability": args.min_probability,
+        "vocabulary": load_vocabulary(args.vocab),
+        "format": args.format,
+        "vad": VAD_FILTER and not args.no_vad,
+        "keep_cache": args.keep_cache,
+        "global_start": args.global_start,
+        "global_end": args.global_end,
+    }
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool, \
+            open(progress_path, "a", encoding="utf-8") as progress:
+        futures = {pool.submit(batch_slice_file, p, args.out, opts): p for p in pending}
+        for i, fut in enumerate(as_completed(futures), 1):
+            path = futures[fut]
+            try:
+                result = fut.result()
+            except Exception as e:
+                failures += 1
+                print(f"[BATCH] ({i}/{len(pending)}) FAILED {os.path.basename(path)}: {e}")
+                continue
+            progress.write(json.dumps(result) + "\n")
+            progress.flush()
+            os.fsync(progress.fileno())
+            rtf = result["duration_s"] / result["seconds"] if result["seconds"] > 0 else 0.0
+            print(f"[BATCH] ({i}/{len(pending)}) {os.path.basename(path)}: "
+                  f"{result['exported']}/{result['words']} words exported, {rtf:0.2f}x realtime")
+    return 1 if failures else 0
+
+
+# -------------------- Re-cut --------------------
+def load_cut_rows(path):
+    """Exported rows and the recorded source path from a project or cutTemplate.txt."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    if path.lower().endswith(".txt"):
+        with open(path, "r", encoding="utf-8") as f:
+            return [w for w in map(parse_cut_template_line, f) if w is not None], None
+    project = ProjectStore(path)
+    try:
+        rows = project.words_between(float("-inf"), float("inf"), exported_only=True)
+        return rows, project.get_meta("source_path")
+    finally:
+        project.close()
+
+
+def _recut_run(source_path, jobs, dtype, fmt):
+    """Worker: one handle on the source, seek + read for each clip of a sorted run."""
+    with sf.SoundFile(source_path) as f:
+        for out_path, f0, f1 in jobs:
+            f.seek(f0)
+            pcm = as_int_pcm(f.read(f1 - f0, dtype=dtype, always_2d=True))
+            write_clip(out_path, pcm, f.samplerate, fmt)
+    return len(jobs)
+
+
+def recut(rows, source_path, out_dir=EXPORT_DIR, fmt="wav", workers=EXPORT_WORKERS):
+    """Re-render exported words from their stored margins, without transcribing.
+
+    Clips keep the file names recorded in the rows, so re-cutting into the
+    original export folder after a source remaster leaves the project valid.
+    Each worker seeks to the frames of one start-sorted run of clips; sources
+    libsndfile cannot open fall back to the cached full decode. Returns the
+    number of clips written.
+    """
+    try:
+        info = sf.info(source_path)
+        rate, total, pcm = info.samplerate, info.frames, None
+        dtype, _ = sndfile_read_spec(info.subtype)
+    except RuntimeError:
+        source = load_source_audio(source_path)
+        rate, total, pcm = source.frame_rate, len(source.pcm), source.pcm
+
+    jobs = []
+    for i, w in enumerate(sorted(rows, key=lambda w: w["start_ms"]), 1):
+        s_eff, e_eff = effective_ms(w)
+        f0 = min(total, int(s_eff * rate / 1000.0))
+        f1 = min(total, int(e_eff * rate / 1000.0))
+        if f1 <= f0:
+            continue
+        name = os.path.splitext(os.path.basename(w.get("export_path", "")))[0]
+        if not name:
+            name = f"{clean_word(w['word']) or 'word'}_{i:05d}"
+        jobs.append((os.path.join(out_dir, f"{name}.{fmt}"), f0, f1))
+    if not jobs:
+        return 0
+
+    os.makedirs(out_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        if pcm is not None:
+            futures = [pool.submit(write_clip, p, pcm[f0:f1], rate, fmt) for p, f0, f1 in jobs]
+        else:
+            runs = np.array_split(np.arange(len(jobs)), min(workers, len(jobs)))
+            futures = [
+                pool.submit(_recut_run, source_path, [jobs[k] for k in run], dtype, fmt)
+                for run in runs
+            ]
+        for fut in futures:
+            fut.result()
+    return len(jobs)
+
+
+def run_recut(args):
+    t0 = time.time()
+    try:
+        rows, recorded_source = load_cut_rows(args.project)
+    except FileNotFoundError:
+        print(f"[RECUT] {args.project} not found")
+        return 1
+    source_path = args.source or recorded_source
+    if not source_path or not os.path.exists(source_path):
+        print("[RECUT] Source audio not found; pass it with --source")
+        return 1
+    n = recut(rows, source_path, args.out, args.format, max(1, args.jobs))
+    print(f"[RECUT] {n}/{len(rows)} clips from {os.path.basename(source_path)} "
+          f"-> {args.out} in {time.time() - t0:0.2f}s")
+    return 0
+
+
+# -------------------- Benchmarks --------------------
+BENCH_RESULTS_FILE = "bench_results.jsonl"
+BENCH_LENGTHS_S = (60, 600)
+BENCH_ZOOMS = (1, 16, 256)
+BENCH_TIMELINE_PX = 1600
+BENCH_EXPORT_WORDS = 200
+BENCH_TEMPLATE_LINES = 10_000
+# A case is flagged when it is this much slower than the previous run
+BENCH_REGRESSION = 0.20
+
+
+def synth_narration(path, seconds, rate=44100, channels=2, seed=0):
+    """Write a deterministic stand-in for narration: voiced bursts with pauses."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * rate)
+    with sf.SoundFile(path, "w", rate, channels, subtype="PCM_16") as f:
+        for start in range(0, n, DECODE_BLOCK * 8):
+            t = np.arange(start, min(n, start + DECODE_BLOCK * 8)) / rate
+            env = np.clip(np.sin(2 * np.pi * 0.9 * t) * np.sin(2 * np.pi * 0.23 * t), 0.0, None)
+            voice = np.sin(2 * np.pi * 180.0 * t) + 0.3 * rng.standard_normal(len(t))
+            f.write(np.repeat((0.5 * env * voice)[:, None], channels, axis=1))
+
+
+def _bench_best(fn, repeat, setup=None):
+    """Best wall time of `repeat` calls of fn, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _bench_decode(path, repeat, results):
+    name = os.path.basename(path)
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), AUDIO_CACHE_DIR)
+    results[f"decode_cold.{name}"] = (_bench_best(
+        lambda: load_source_audio(path), repeat,
+        setup=lambda: shutil.rmtree(cache_dir, ignore_errors=True),
+    ), "s")
+    results[f"decode_cached.{name}"] = (_bench_best(lambda: load_source_audio(path), repeat), "s")
+    return load_source_audio(path)
+
+
+def _bench_timeline(source, repeat, results):
+    """Full redraws the way update_plot does them, on an off-screen canvas."""
+    total_ms = source.duration_ms
+    words = WordTable.from_dicts(
+        [make_word(f"w{i}", ms, ms + 250.0) for i, ms in enumerate(np.arange(0.0, total_ms - 250.0, 400.0))]
+    )
+    index = WordIntervalIndex()
+    index.rebuild(words.local_starts(), words.local_ends())
+    fig = Figure(figsize=(BENCH_TIMELINE_PX / 100.0, 3), dpi=100)
+    timeline = TimelineRenderer(fig, fig.add_subplot(), FigureCanvasAgg(fig))
+    length = f"{round(total_ms / 1000.0)}s"
+    for zoom in BENCH_ZOOMS:
+        start_norm = 0.5 - 0.5 / zoom
+        end_norm = 0.5 + 0.5 / zoom
+
+        def redraw():
+            visible = index.overlapping(start_norm * total_ms, end_norm * total_ms)
+            timeline.draw_static(source.peaks, start_norm, end_norm, BENCH_TIMELINE_PX, total_ms,
+                                 words.effective_starts(0.0, visible), words.effective_ends(0.0, visible))
+            timeline.set_overlay(0.5, (0.0, total_ms), (total_ms / 2, total_ms / 2 + 250.0))
+            timeline.draw()
+
+        results[f"timeline.{length}.x{zoom}"] = (_bench_best(redraw, repeat), "s")
+    timeline.set_overlay(0.25, (0.0, total_ms))
+    results[f"timeline_blit.{length}"] = (_bench_best(timeline.blit, repeat), "s")
+
+
+def _bench_export(source, out_dir, repeat, results):
+    rate = source.frame_rate
+    step = max(1, len(source.pcm) // BENCH_EXPORT_WORDS)
+    clips = [(f0, min(len(source.pcm), f0 + rate // 2)) for f0 in range(0, len(source.pcm), step)]
+    clips = clips[:BENCH_EXPORT_WORDS]
+    for fmt in EXPORT_FORMATS:
+        def run():
+            pool = ExportPool()
+            for k, (f0, f1) in enumerate(clips):
+                path = os.path.join(out_dir, f"w{k:05d}.{fmt}")
+                pool.submit(k, {}, path, source.pcm[f0:f1], rate, fmt)
+            pool.shutdown()
+            for _key, _word, error in pool.drain():
+                if error is not None:
+                    raise error
+        results[f"export.{len(clips)}x{fmt}"] = (_bench_best(run, repeat), "s")
+
+
+def _bench_template(tmp, repeat, results):
+    template = os.path.join(tmp, CUT_TEMPLATE_FILE)
+    with open(template, "w", encoding="utf-8") as f:
+        for i in range(BENCH_TEMPLATE_LINES):
+            f.write(f"word{i},{i * 400.0},{i * 400.0 + 250.0},0.0,0.0,0.0,0.0,"
+                    f"{EXPORT_DIR}/word{i}_{i + 1}.wav\n")
+    project = ProjectStore(os.path.join(tmp, PROJECT_FILE))
+    try:
+        n = BENCH_TEMPLATE_LINES // 1000
+        results[f"template_import.{n}k"] = (_bench_best(
+            lambda: project.import_cut_template(template), repeat, setup=project.clear
+        ), "s")
+        results[f"template_load.{n}k"] = (_bench_best(project.load_words, repeat), "s")
+    finally:
+        project.close()
+
+
+def _bench_transcribe(sizes, source, repeat, results):
+    """Realtime factor per model size (higher is better)."""
+    audio = source.whisper[:60 * 16000]
+    seconds = len(audio) / 16000.0
+    for size in sizes:
+        t0 = time.perf_counter()
+        model = WHISPER_MODELS.get(size, WHISPER_COMPUTE_TYPE, WHISPER_DEVICE)
+        results[f"model_load.{size}"] = (time.perf_counter() - t0, "s")
+        best = _bench_best(lambda: list(transcribe_words(model, audio, 16000, vad=VAD_FILTER)), repeat)
+        results[f"transcribe_rtf.{size}"] = (seconds / best if best > 0 else 0.0, "x")
+
+
+def _bench_regressions(results, previous, threshold=BENCH_REGRESSION):
+    """Names of cases that got worse than `previous` by more than `threshold`."""
+    flagged = []
+    for name, (value, unit) in results.items():
+        if name not in previous:
+            continue
+        before = previous[name][0]
+        if unit == "x":
+            worse = value < before / (1.0 + threshold)
+        else:
+            worse = value > before * (1.0 + threshold)
+        if worse:
+            flagged.append(name)
+    return flagged
+
+
+def run_bench(args):
+    host = platform.node()
+    previous = {}
+    if os.path.exists(args.results):
+        with open(args.results, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    run = json.loads(line)
+                except ValueError:
+                    continue
+                if run.get("host") == host:
+                    previous = run["results"]
+
+    results = {}
+    repeat = max(1, args.repeat)
+    with tempfile.TemporaryDirectory(prefix="bts_bench_") as tmp:
+        sources = []
+        for seconds in args.lengths:
+            path = os.path.join(tmp, f"synth_{int(seconds)}s.wav")
+            synth_narration(path, seconds)
+            sources.append(path)
+        for path in args.audio or []:
+            sources.append(shutil.copy(path, tmp))
+
+        loaded = []
+        for path in sources:
+            print(f"[BENCH] {os.path.basename(path)}")
+            loaded.append(_bench_decode(path, repeat, results))
+            if path.startswith(os.path.join(tmp, "synth_")):
+                _bench_timeline(loaded[-1], repeat, results)
+
+        out_dir = os.path.join(tmp, EXPORT_DIR)
+        os.makedirs(out_dir)
+        _bench_export(loaded[0], out_dir, repeat, results)
+        _bench_template(tmp, repeat, results)
+        if args.models:
+            # Real speech (a fixture) gives a meaningful RTF; synthetic audio is the fallback
+            _bench_transcribe(args.models, loaded[-1], repeat, results)
+
+    flagged = _bench_regressions(results, previous, args.threshold)
+    for name, (value, unit) in results.items():
+        before = previous.get(name)
+        change = ""
+        if before and before[0]:
+            change = f"{(value / before[0] - 1.0) * 100.0:+6.1f}%"
+        mark = "  REGRESSION" if name in flagged else ""
+        shown = f"{value * 1000.0:10.2f} ms" if unit == "s" else f"{value:10.2f} x "
+        print(f"[BENCH] {name:<34} {shown} {change}{mark}")
+
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "host": host,
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "repeat": repeat,
+        "results": results,
+    }
+    with open(args.results, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    if flagged:
+        print(f"[BENCH] {len(flagged)} case(s) regressed more than {args.threshold:.0%} since the last run")
+        return 1
+    return 0
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="bootleg-slicer",
+        description="Bootleg Text Slicer. Run without a command to open the editor."
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    batch = sub.add_parser("batch", help="Transcribe and slice audio files without a display.")
+    batch.add_argument("inputs", nargs="+", help="Audio files, directories or glob patterns.")
+    batch.add_argument("-o", "--out", default="BatchWords", help="Output directory (default: BatchWords).")
+    batch.add_argument("-j", "--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                       help="Files processed in parallel.")
+    batch.add_argument("--model", default=WHISPER_MODEL_SIZE)
+    batch.add_argument("--compute-type", default=WHISPER_COMPUTE_TYPE)
+    batch.add_argument("--min-duration", type=float, default=0.08,
+                       help="Minimum effective word duration in seconds.")
+    batch.add_argument("--min-probability", type=float, default=0.0,
+                       help="Minimum Whisper word probability (0-1).")
+    batch.add_argument("--vocab", help="Only export words listed in this file (one per line).")
+    batch.add_argument("--format", choices=EXPORT_FORMATS, default="wav", help="Clip format.")
+    batch.add_argument("--no-vad", action="store_true", help="Send silence to Whisper too.")
+    batch.add_argument("--global-start", type=float, default=0.0, help="Global start margin (s).")
+    batch.add_argument("--global-end", type=float, default=0.0, help="Global end margin (s).")
+    batch.add_argument("--restart", action="store_true", help=f"Ignore {BATCH_PROGRESS_FILE}.")
+    batch.add_argument("--keep-cache", action="store_true",
+                       help="Keep each source's decode cache after it is sliced.")
+    batch.set_defaults(func=run_batch)
+
+    recut_cmd = sub.add_parser("recut", help="Re-render exported words from a project, no transcription.")
+    recut_cmd.add_argument("project", nargs="?", default=PROJECT_FILE,
+                           help=f"{PROJECT_FILE} or a legacy {CUT_TEMPLATE_FILE}.")
+    recut_cmd.add_argument("-s", "--source", help="Source audio (default: the one recorded in the project).")
+    recut_cmd.add_argument("-o", "--out", default=EXPORT_DIR, help=f"Output directory (default: {EXPORT_DIR}).")
+    recut_cmd.add_argument("--format", choices=EXPORT_FORMATS, default="wav", help="Clip format.")
+    recut_cmd.add_argument("-j", "--jobs", type=int, default=EXPORT_WORKERS, help="Parallel writers.")
+    recut_cmd.set_defaults(func=run_recut)
+
+    bench = sub.add_parser("bench", help="Time the hot paths headless and compare with the last run.")
+    bench.add_argument("--lengths", type=float, nargs="+", default=list(BENCH_LENGTHS_S),
+                       help="Synthetic source lengths in seconds.")
+    bench.add_argument("--audio", nargs="+", help="Extra fixture files (e.g. CC0 narration).")
+    bench.add_argument("--models", nargs="+", help="Whisper sizes to measure realtime factor for.")
+    bench.add_argument("--repeat", type=int, default=3, help="Runs per case; the best one counts.")
+    bench.add_argument("--results", default=BENCH_RESULTS_FILE, help="JSONL history of runs.")
+    bench.add_argument("--threshold", type=float, default=BENCH_REGRESSION,
+                       help="Relative slow-down flagged as a regression.")
+    bench.set_defaults(func=run_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    with profiling():
+        if args.command:
+            return args.func(args)
+        app = BootlegTextSlicer()
+        app.mainloop()
+        return 0
+
 
 if __name__ == "__main__":
-    app = BootlegTextSlicer()
-    app.mainloop()
+    sys.exit(main())
 